@@ -79,7 +79,8 @@ async def receive_whatsapp_message(
     logger.info(f"Headers: {dict(request.headers)}")
     
     # Log raw payload
-    logger.info(f"Raw payload: {json.dumps(payload, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Raw payload: %s", json.dumps(payload, indent=2, default=str))
     
     # Signature verification (optional, gated by settings)
     if getattr(settings, 'ENABLE_WHATSAPP_SIGNATURE_VERIFICATION', False):
@@ -366,7 +367,8 @@ async def receive_baileys_message(
         if not verify_baileys_hmac(request.headers, raw):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Baileys signature invalid")
     try:
-        logger.info(f"Baileys payload: {json.dumps(payload, indent=2, default=str)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Baileys payload: %s", json.dumps(payload, indent=2, default=str))
     except Exception:
         logger.info("Baileys payload could not be JSON-encoded for logging")
 
@@ -15,19 +15,28 @@ from app.utils.mongo_service import MongoService
 from config import settings
 from app.utils.baileys_client import BaileysClient
 import logging
+import logging.handlers
+import queue
 import sys
 import httpx
 import asyncio
 
-# Configure logging
+# Configure logging: request handlers only enqueue records; a background
+# listener thread does the formatting and console/file I/O.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),  # Console output
+    logging.FileHandler('hustlr_bot.log', mode='a')  # File output
+]
+for _h in _log_handlers:
+    _h.setFormatter(_log_formatter)
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),  # Console output
-        logging.FileHandler('hustlr_bot.log', mode='a')  # File output
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+log_listener.start()
 
 # Create FastAPI app
 app = FastAPI(title="Hustlr WhatsApp Bot")
@@ -67,6 +76,10 @@ async def on_startup():
 @app.on_event("shutdown")
 async def on_shutdown():
     await close_mongo_connection()
+    try:
+        log_listener.stop()
+    except Exception:
+        pass
 
 # Include API routes
 app.include_router(whatsapp.router, prefix="/api/whatsapp", tags=["WhatsApp"])
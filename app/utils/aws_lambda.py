@@ -1,7 +1,8 @@
 import os
-import boto3
 import json
+import boto3
 import logging
+import orjson
 from typing import Dict, Any, Optional
 from botocore.exceptions import ClientError
 from botocore.config import Config
@@ -86,15 +87,15 @@ class AWSLambdaService:
             logger.info(f"[BEDROCK INVOKE] modelId={bedrock_model_id}, region={self.aws_region}")
             response = self.bedrock_client.invoke_model(
                 modelId=bedrock_model_id,
-                body=json.dumps(body).encode("utf-8"),
+                body=orjson.dumps(body),
                 contentType="application/json",
                 accept="application/json",
             )
             raw_body = response.get("body")
             if hasattr(raw_body, "read"):
-                parsed = json.loads(raw_body.read())
+                parsed = orjson.loads(raw_body.read())
             else:
-                parsed = json.loads(raw_body)
+                parsed = orjson.loads(raw_body)
 
             # Extract main text from Claude response
             final_text: Optional[str] = None
@@ -184,13 +185,13 @@ class AWSLambdaService:
         tool_result = user_context.get('tool_result')
         tool_text = f"Tool result available:\n{tool_result}" if tool_result else ""
         provider_options = user_context.get('provider_options')
-        providers_text = f"Provider options (JSON):\n{json.dumps(provider_options, default=str)}" if provider_options else ""
+        providers_text = f"Provider options (JSON):\n{orjson.dumps(provider_options, default=str).decode()}" if provider_options else ""
 
         # known_fields may contain Mongo ObjectId or other non-JSON types; coerce to strings
         known_fields = user_context.get('known_fields')
         if known_fields:
             try:
-                known_fields_json = json.dumps(known_fields, default=str)
+                known_fields_json = orjson.dumps(known_fields, default=str).decode()
             except TypeError:
                 # Last-resort: stringify the whole object
                 known_fields_json = str(known_fields)
@@ -538,15 +539,15 @@ Guidelines:
         }
         response = self.bedrock_client.invoke_model(
             modelId=model_for_invoke,
-            body=json.dumps(body).encode("utf-8"),
+            body=orjson.dumps(body),
             contentType="application/json",
             accept="application/json",
         )
         raw_body = response.get("body")
         if hasattr(raw_body, "read"):
-            parsed = json.loads(raw_body.read())
+            parsed = orjson.loads(raw_body.read())
         else:
-            parsed = json.loads(raw_body)
+            parsed = orjson.loads(raw_body)
         final_text = None
         content = parsed.get("content")
         if isinstance(content, list):
@@ -594,7 +595,7 @@ Guidelines:
                 "providers": providers,
                 "top_k": int(top_k or 5),
             }
-            user_text = json.dumps(payload, default=str)
+            user_text = orjson.dumps(payload, default=str).decode()
             out = self._invoke_bedrock_messages(system_prompt, user_text, max_tokens=600, temperature=0.2)
             arr = self._parse_json_array(out)
             return arr
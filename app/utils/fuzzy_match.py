@@ -1,3 +1,4 @@
+import re
 from typing import List, Optional, Sequence
 from rapidfuzz import fuzz, process
 
@@ -146,13 +147,16 @@ SERVICE_ALIASES = {
 CANONICAL_SERVICES = sorted(set(SERVICE_ALIASES.values()))
 ALIAS_KEYS = list(SERVICE_ALIASES.keys())
 
+# All aliases in one pattern, in SERVICE_ALIASES (priority) order. The lookahead
+# lets the scan try every position, so overlapping aliases are all seen; at each
+# position the alternation yields the highest-priority alias starting there.
+_ALIAS_RANK = {alias: i for i, alias in enumerate(ALIAS_KEYS)}
+_ALIAS_SCAN_RE = re.compile("(?=(" + "|".join(map(re.escape, ALIAS_KEYS)) + "))")
+_HAS_LETTER_RE = re.compile(r"[a-z]")
 
-def _best_match(text: str, choices: Sequence[str], threshold: int = 80) -> Optional[str]:
-    if not text:
-        return None
-    q = (text or "").strip().lower()
-    if not q:
-        return None
+
+def _best_match(q: str, choices: Sequence[str], threshold: int = 80) -> Optional[str]:
+    """Fuzzy pick from choices; q must already be stripped, lowercased and non-empty."""
     # Prefer token_set_ratio for robustness to word order
     match = process.extractOne(q, choices, scorer=fuzz.token_set_ratio)
     if match and match[1] >= threshold:
@@ -163,11 +167,13 @@ def _best_match(text: str, choices: Sequence[str], threshold: int = 80) -> Optio
 def find_best_service_match(text: str, threshold: int = 80) -> Optional[str]:
     # Substring quick path over aliases
     q = (text or "").strip().lower()
-    if not q:
+    # Every alias is alphabetic, so letterless replies ("2", "10:00", phone
+    # numbers) can neither contain one nor fuzzy-score near the threshold
+    if not q or not _HAS_LETTER_RE.search(q):
         return None
-    for alias, canonical in SERVICE_ALIASES.items():
-        if alias in q:
-            return canonical
+    best = min((_ALIAS_RANK[a] for a in _ALIAS_SCAN_RE.findall(q)), default=None)
+    if best is not None:
+        return SERVICE_ALIASES[ALIAS_KEYS[best]]
     # Fuzzy over aliases
     alias = _best_match(q, ALIAS_KEYS, threshold)
     if alias:
@@ -183,12 +189,14 @@ def find_best_location_match(text: str, candidates: Sequence[str], threshold: in
     q = (text or "").strip().lower()
     if not q or not candidates:
         return None
-    # Substring quick path
+    # Substring quick path (q in candidate only counts for 3+ characters)
+    q_can_be_inside = len(q) >= 3
     for cand in candidates:
         try:
-            if cand and cand.lower() in q:
-                return cand
-            if cand and q in cand.lower() and len(q) >= 3:
+            if not cand:
+                continue
+            c = cand.lower()
+            if c in q or (q_can_be_inside and q in c):
                 return cand
         except Exception:
             continue
@@ -2,9 +2,16 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from dateutil.parser import parse as du_parse
 from enum import Enum
+from functools import lru_cache
+from collections import OrderedDict
+from itertools import islice
+import asyncio
 import re
+import time
+import weakref
 import logging
 import json
+import orjson
 from app.models.message import WhatsAppMessage
 from app.utils.location_extractor import get_location_extractor
 from app.utils.fuzzy_match import find_best_service_match, find_best_location_match
@@ -12,7 +19,259 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
-class ConversationState(Enum):
+
+# Admin command patterns, compiled once for the admin message path
+ADMIN_CMD_RE = re.compile(r"^\s*(approve|deny)\s+(.+)$")
+PHONE_CLEAN_RE = re.compile(r"\D+")
+OBJECT_ID_RE = re.compile(r"[0-9a-f]{24}")
+ADMIN_PROVIDER_ARG_RE = re.compile(r"provider\s+([\w\+\-]+)$", re.I)
+ADMIN_REASON_RE = re.compile(r"reason=\"([^\"]*)\"")
+
+
+def normalize_msisdn(phone: str) -> Optional[str]:
+    s = PHONE_CLEAN_RE.sub("", str(phone or ""))
+    if not s:
+        return None
+    if s.startswith("0") and len(s) >= 9:
+        return "263" + s[1:]
+    if s.startswith("7") and len(s) >= 9:
+        return "263" + s
+    if s.startswith("263"):
+        return s
+    if len(s) >= 9:
+        return "263" + s
+    return s
+
+
+def load_admin_numbers() -> List[str]:
+    """Normalized admin numbers from settings, in configured order."""
+    try:
+        raw = getattr(settings, 'ADMIN_WHATSAPP_NUMBERS', "") or ""
+    except Exception:
+        raw = ""
+    if isinstance(raw, (list, tuple)):
+        vals = list(raw)
+    else:
+        vals = [p.strip() for p in str(raw).replace(";", ",").split(",") if p.strip()]
+    if not vals:
+        vals = ['+263783961640', '+263775251636', '+263777530322', '+16509965727']
+    norm = []
+    for v in vals:
+        n = normalize_msisdn(v)
+        if n:
+            norm.append(n)
+    return list(dict.fromkeys(norm))
+
+
+# Resolved once at import: ordered tuple for fan-out, frozenset for O(1) membership checks
+ADMIN_NUMBERS_ORDERED: tuple = tuple(load_admin_numbers())
+ADMIN_NUMBERS: frozenset = frozenset(ADMIN_NUMBERS_ORDERED)
+
+NEW_PROVIDER_ADMIN_TMPL = (
+    "New provider registration\n"
+    "Name: {name}\n"
+    "Service: {service_type}\n"
+    "Location: {location}\n"
+    "Phone: {phone}\n"
+    "Reply APPROVE <number> to approve, or DENY <number> to reject."
+)
+
+# Ordinal words for picking a provider from a shown list ("the second one")
+ORDINAL_MAP: Dict[str, int] = {
+    'first': 1, '1st': 1, 'one': 1,
+    'second': 2, '2nd': 2, 'two': 2,
+    'third': 3, '3rd': 3, 'three': 3,
+    'fourth': 4, '4th': 4, 'four': 4,
+    'fifth': 5, '5th': 5, 'five': 5,
+}
+ORDINAL_RE = re.compile(r"\b(" + "|".join(ORDINAL_MAP) + r")\b")
+PROVIDER_BUTTON_RE = re.compile(r"\bprovider_([a-zA-Z0-9+_\-]+)\b")
+
+@lru_cache(maxsize=2048)
+def _du_parse_lru(text: str, default: datetime, dayfirst: bool) -> Optional[datetime]:
+    try:
+        return du_parse(text, fuzzy=True, default=default, dayfirst=dayfirst)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _du_parse_cached(text: str, default: datetime, dayfirst: bool = False) -> Optional[datetime]:
+    """Memoized fuzzy dateutil parse; returns None instead of raising.
+
+    The key is the lowercased, whitespace-collapsed text (dateutil ignores
+    both), so "Tomorrow  10AM" and "tomorrow 10am" share an entry. Callers
+    truncate ``default`` (to the minute, or the hour for day-word bases) so
+    repeated phrases hit the cache.
+    """
+    return _du_parse_lru(" ".join(text.lower().split()), default, dayfirst)
+
+
+# Already-normalized "YYYY-MM-DD HH:MM[:SS]" input (e.g. from the model or a stored booking)
+ISO_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}[ t]\d{2}:\d{2}(?::\d{2})?")
+
+def _fmt_booking_time(dt: datetime) -> str:
+    """Format as "%Y-%m-%d %H:%M" without going through strftime."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+# Booking time display format ("%Y-%m-%d %H:%M") and the ISO-8601 date prefix
+DISPLAY_TIME_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}")
+ISO_PREFIX_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Relative/natural time patterns used by _parse_relative_time
+RELATIVE_OFFSET_RE = re.compile(r"\s(in|for)\s+(\d+)\s+(minute|hour|day|week)s?(\s|$)")
+DATE_HINT_RE = re.compile(
+    r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b"
+    r"|\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b"
+    r"|\b\d{1,2}/\d{1,2}\b",
+    re.I,
+)
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+WEEKDAY_IDX: Dict[str, int] = {name: i for i, name in enumerate(WEEKDAYS)}
+NEXT_THIS_WEEKDAY_RE = re.compile(r"(next|this) (" + "|".join(WEEKDAYS) + r")")
+# Substrings that can trigger a day-word branch (today/tomorrow/tonight/now, next/this <weekday>)
+DAY_WORD_HINT_RE = re.compile(r"tomorrow|today|tonight|now|next |this ")
+# Day words stripped before parsing the rest of the phrase ("tomorrow 3pm" -> "3pm")
+DAY_WORD_RES: Dict[str, re.Pattern] = {
+    w: re.compile(fr"\b{w}\b", re.I)
+    for w in ('tomorrow', 'today', 'tonight', *(f'{p} {d}' for p in ('next', 'this') for d in WEEKDAYS))
+}
+
+# Booking-list replies ("2", "postpone")
+BOOKING_NUM_RE = re.compile(r"\b(\d+)\b")
+VIEW_RESCHEDULE_RE = re.compile(r"reschedule|postpone|change time|move booking")
+
+
+def _booking_number(message_text: Any) -> Optional[int]:
+    """The number picked from a booking list; a bare "2" skips the regex."""
+    raw = str(message_text or '').strip()
+    if raw.isdecimal():
+        return int(raw)
+    m = BOOKING_NUM_RE.search(raw)
+    return int(m.group(1)) if m else None
+
+
+# Replies accepted as "yes" at the reschedule confirmation step
+_CONFIRM_WORDS: frozenset = frozenset({'yes', 'y', 'confirm', 'ok', 'sure'})
+# Session keys that track an in-progress reschedule; cleared together when it ends
+_RESCHED_KEYS = ("_reschedule_booking_id", "_reschedule_new_time", "_bookings_list")
+# Reschedule replies
+_RESCHED_CONFIRM_TMPL = "Reschedule to {}? Reply 'yes' to confirm or 'no' to keep the original time.".format
+_RESCHED_OK_TMPL = "Your booking has been rescheduled to {}.".format
+_RESCHED_ABORT_MSG = "Okay, I will keep your original booking time."
+_RESCHED_FAILED_MSG = "Sorry, I couldn't reschedule that booking right now. Please try again."
+# A go-ahead sent together with the new time ("yes, tomorrow 10am")
+_RESCHED_CONFIRM_INLINE_RE = re.compile(r"\b(?:yes|confirm|ok)\b", re.I)
+# Longer replies are pastes or chatter, not a date/time phrase
+MAX_TIME_TEXT_LEN = 64
+# Text with none of these (no digit, day word, weekday or month) cannot parse as a time
+_DT_HINT_RE = re.compile(
+    r"\d|today|tomorrow|tonight|now|mon|tue|wed|thu|fri|sat|sun"
+    r"|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec",
+    re.I,
+)
+
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-flight
+_BG_TASKS: set = set()
+# Every live handler (cloud, Baileys, QA) shares one Mongo, so per-number memory
+# is dropped on all of them at once when a user is reset or deleted
+_HANDLERS: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _spawn_background(coro, label: str) -> None:
+    async def _run():
+        try:
+            await coro
+        except Exception as e:
+            logger.error(f"Background {label} failed: {e}")
+    task = asyncio.create_task(_run())
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
+
+
+# Per-message text patterns: pre-normalization, exits, onboarding and menu
+HRS_COMPACT_RE = re.compile(r"\b(\d{3,4})\s*hrs\b", re.I)
+HRS_COLON_RE = re.compile(r"\b(\d{1,2}):(\d{2})\s*hrs\b", re.I)
+WS_RE = re.compile(r"\s+")
+THANKS_RE = re.compile(r"\s*(ok(ay)?\s+)?(thanks|thank you)[\w\s\.!]*\s*")
+NAME_LOC_SPLIT_RE = re.compile(r'[,\n\-]+')
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+POLICY_QUESTION_RE = re.compile(r"\b(compensat|refund|pay\s*back|liabilit(y|ies)|policy)\b")
+
+# Whole-message intents checked on every turn (exact match after normalization)
+GREETING_WORDS = frozenset({'hi', 'hello', 'hey', 'start', 'menu'})
+EXIT_PHRASES = frozenset({
+    "thanks", "thank you", "ok thanks", "okay thanks", "bye", "goodbye", "cheers",
+    "no thanks", "done", "that's all", "thats all",
+})
+# Substring match, as the old keyword scan had ("later" also covers "maybe later")
+PAUSE_RE = re.compile(r"not now|later|not yet")
+PRIVACY_AGREE_WORDS = frozenset({'yes', 'y', 'agree', 'ok', 'sure'})
+SKIP_WORDS = frozenset({'skip', 'no', 'none', 'na', 'n/a', ''})
+
+# Main-menu reschedule intent (substring semantics, as the old keyword list had;
+# the single-word bookings/cancel intents are plain `in` checks)
+MENU_RESCHEDULE_RE = re.compile(r"reschedule|change time|move booking")
+
+def _short_static(long_text: str, short_text: str) -> str:
+    """Module-level twin of MessageHandler._short for import-time constants."""
+    if getattr(settings, 'LLM_CONTROLLED_CONVERSATION', False):
+        return long_text
+    return short_text if getattr(settings, 'USE_CONCISE_RESPONSES', False) else long_text
+
+
+# Follow-up question per missing booking slot, resolved once at import
+_FALLBACK_Q: Dict[str, str] = {
+    'service': _short_static("What service do you need? For example: plumber, electrician, cleaner.", "What service do you need?"),
+    'location': _short_static("Which area should I search in? (e.g., Harare, Bulawayo)", "Your area?"),
+    'datetime': _short_static("When would you like the service? (e.g., 'tomorrow 10am')", "When? (e.g., tomorrow 10am)"),
+    'budget': _short_static("Do you have a budget in mind? (You can say 'skip' if you're not sure)", "Budget? ('skip' if unsure)"),
+}
+_FALLBACK_Q['time'] = _FALLBACK_Q['date'] = _FALLBACK_Q['datetime']
+
+def _loads_json(text: str) -> Any:
+    """Parse model JSON with orjson, falling back to stdlib json for what orjson rejects (e.g. NaN)."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+# An unchanged session is still re-written at least this often, so the stored
+# last_activity stays roughly current
+SESSION_CACHE_TTL = 300.0
+# Idle time after which a conversation starts over
+SESSION_EXPIRY_SECONDS = 24 * 3600
+# Touched on every turn; left out when deciding whether a session changed
+_SESSION_VOLATILE_KEYS = frozenset({'last_activity', 'last_activity_ts', 'fsm_state'})
+
+
+def _session_fingerprint(session: Dict[str, Any]) -> Optional[bytes]:
+    """Canonical bytes of a session's non-volatile content, or None if it can't be encoded."""
+    try:
+        return orjson.dumps(
+            {k: v for k, v in session.items() if k not in _SESSION_VOLATILE_KEYS},
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    except TypeError:
+        return None
+
+
+# Provider lookups per (service_type, location), including empty results
+PROVIDER_CACHE_TTL = 15.0
+PROVIDER_CACHE_MAX = 512
+
+# Parsed booking times per (normalized text, minute); relative phrases stay correct per minute
+DT_CACHE_MAX = 1024
+
+
+# Row ids for the "Select area" list (WhatsApp lists allow at most 10 rows)
+_LOC_ROW_IDS = tuple(f"loc_{i}" for i in range(1, 11))
+
+# str-valued so the stored session value round-trips unchanged; the str mixin also
+# gives members C-level hashing and equality in dispatch lookups.
+class ConversationState(str, Enum):
     # Onboarding states
     NEW = "new"
     ONBOARDING_NAME = "onboarding_name"
@@ -51,6 +310,205 @@ class ConversationState(Enum):
     PROVIDER_REGISTER_BUSINESS = "provider_register_business"
     PROVIDER_REGISTER_CONTACT = "provider_register_contact"
 
+
+# Stored string <-> enum, without going through Enum.__call__ or the .value descriptor
+_STATE_BY_VALUE: Dict[str, ConversationState] = dict(ConversationState._value2member_map_)
+_STATE_VALUES: Dict[ConversationState, str] = {s: s.value for s in ConversationState}
+
+
+# Keyword -> canonical service for extract_service_type. Order matters: the
+# first keyword (in this order) that occurs in the message wins.
+SERVICE_KEYWORDS: Dict[str, str] = {
+    'plumber': 'plumber',
+    'plumbing': 'plumber',
+    'electrician': 'electrician',
+    'electrical': 'electrician',
+    'electricity': 'electrician',
+    'carpenter': 'carpenter',
+    'carpentry': 'carpenter',
+    'wood': 'carpenter',
+    'painter': 'painter',
+    'painting': 'painter',
+    'cleaner': 'cleaner',
+    'cleaning': 'cleaner',
+    'mechanic': 'mechanic',
+    'repair': 'mechanic',
+    'gardener': 'gardener',
+    'gardening': 'gardener',
+    'landscaping': 'gardener',
+    'builder': 'builder',
+    'building': 'builder',
+    'construction': 'builder',
+    'welder': 'welder',
+    'welding': 'welder',
+    'driver': 'driver',
+    'driving': 'driver',
+    'transport': 'driver',
+    'tiler': 'tiler',
+    'tiling': 'tiler',
+    'technician': 'technician',
+    'gadget': 'technician',
+    'appliance': 'technician',
+    'dstv': 'technician',
+    'cctv': 'technician',
+    'solar': 'technician',
+    'inverter': 'technician',
+    'fridge': 'technician',
+    'refridgeration': 'technician',
+    'aircon': 'technician',
+    'air con': 'technician',
+    'air-con': 'technician',
+    'airconditioner': 'technician',
+    'air conditioner': 'technician',
+    'air-conditioner': 'technician',
+    'laundry': 'laundry',
+    'washing': 'laundry',
+    'ironing': 'laundry',
+    'gas': 'gas',
+    'refill': 'gas',
+    'tutor': 'tutor',
+    'tution': 'tutor',
+    'lessons': 'tutor',
+    'extra lessons': 'tutor',
+    'catering': 'catering',
+    'caterer': 'catering',
+    'food': 'catering',
+    'events': 'catering',
+    'chef': 'catering',
+    'cook': 'catering',
+    'photography': 'photography',
+    'photographer': 'photography',
+    'photos': 'photography',
+    'videos': 'photography',
+    'video': 'photography',
+    'videographer': 'photography',
+    'designer': 'designer',
+    'graphic': 'designer',
+    'design': 'designer',
+    # Software/engineering keywords
+    'software developer': 'developer',
+    'software': 'developer',
+    'developer': 'developer',
+    'programmer': 'developer',
+    'engineer': 'developer',
+    'web developer': 'developer',
+    'frontend': 'developer',
+    'backend': 'developer',
+    'mobile': 'developer',
+    'android': 'developer',
+    'ios': 'developer',
+    'flutter': 'developer',
+    'react': 'developer',
+    'tailor': 'tailor',
+    'dressmaker': 'tailor',
+    'sewing': 'tailor',
+    'alterations': 'tailor',
+    'beautician': 'beautician',
+    'beauty': 'beautician',
+    'nails': 'beautician',
+    'manicure': 'beautician',
+    'pedicure': 'beautician',
+    'makeup': 'beautician',
+    'artist': 'beautician',
+    'hair': 'beautician',
+    'stylist': 'beautician',
+    'barber': 'beautician',
+    'salon': 'beautician',
+    'massage': 'massage',
+    'therapist': 'massage',
+    'therapy': 'massage',
+    'fitness': 'fitness',
+    'trainer': 'fitness',
+    'gym': 'fitness',
+    'coach': 'fitness',
+    'health': 'fitness',
+    'nutritionist': 'fitness',
+    'dietician': 'fitness',
+    'accountant': 'accountant',
+    'accounting': 'accountant',
+    'bookkeeper': 'accountant',
+    'tax': 'accountant',
+    'consultant': 'consultant',
+    'business': 'consultant',
+    'strategy': 'consultant',
+    'marketing': 'consultant',
+    'legal': 'legal',
+    'lawyer': 'legal',
+    'attorney': 'legal',
+    'paralegal': 'legal',
+    'security': 'security',
+    'guard': 'security',
+    'bouncer': 'security',
+    'alarm': 'security',
+    'fumigation': 'fumigation',
+    'pest': 'fumigation',
+    'control': 'fumigation',
+    'fumigator': 'fumigation',
+    'interior': 'interior',
+    'decorator': 'interior',
+    'design': 'interior',
+    'furniture': 'interior',
+    'upholstery': 'interior',
+    'courier': 'courier',
+    'delivery': 'courier',
+    'errands': 'courier',
+    'logistics': 'courier',
+    'car': 'car',
+    'rental': 'car',
+    'hire': 'car',
+    'vehicle': 'car',
+    'event': 'event',
+    'planner': 'event',
+    'planning': 'event',
+    'mc': 'event',
+    'dj': 'event',
+    'sound': 'event',
+    'hire': 'event',
+    'real': 'real',
+    'estate': 'real',
+    'agent': 'real',
+    'property': 'real',
+    'realtor': 'real',
+    ' borehole': 'borehole',
+    'drilling': 'borehole',
+    'water': 'borehole',
+    'survey': 'borehole',
+    'casing': 'borehole',
+    'installation': 'borehole',
+    'pump': 'borehole',
+    'tank': 'borehole',
+    'stand': 'borehole',
+    'recruiter': 'recruiter',
+    'recruitment': 'recruiter',
+    'hiring': 'recruiter',
+    'staffing': 'recruiter',
+}
+# Any service keyword, in one scan (cheap pre-screen before collecting preferences)
+SERVICE_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in SERVICE_KEYWORDS))
+# The same keywords in priority order inside a lookahead: every position is tried,
+# so overlapping keywords are all seen, and the lowest-ranked hit is the one the
+# old first-match loop over SERVICE_KEYWORDS returned
+SERVICE_KEYWORD_RANK: Dict[str, int] = {k: i for i, k in enumerate(SERVICE_KEYWORDS)}
+SERVICE_KEYWORD_SCAN_RE = re.compile("(?=(" + "|".join(re.escape(k) for k in SERVICE_KEYWORDS) + "))")
+
+
+@lru_cache(maxsize=2048)
+def _service_type_from_text(message_text: str) -> Optional[str]:
+    """Keyword match, then rapidfuzz aliases; memoized since short requests repeat."""
+    keyword = min(SERVICE_KEYWORD_SCAN_RE.findall(message_text), key=SERVICE_KEYWORD_RANK.__getitem__, default=None)
+    if keyword is not None:
+        return SERVICE_KEYWORDS[keyword]
+    # Fuzzy fallback using rapidfuzz aliases
+    try:
+        fuzzy = find_best_service_match(message_text)
+        if fuzzy:
+            return fuzzy
+    except Exception:
+        pass
+
+    return None
+
+
 class MessageHandler:
     """Advanced message handler for WhatsApp conversations"""
 
@@ -59,7 +517,18 @@ class MessageHandler:
         self.db = dynamodb_service
         self.lambda_service = lambda_service
         self.user_sessions = {}  # In-memory session store (consider Redis for production)
+        _HANDLERS.add(self)
+        # Last written (fingerprint, monotonic time) per number, to skip unchanged writes
+        self._session_fprint: Dict[str, tuple] = {}
+        # Response-style flags are read once; settings are fixed for the process lifetime
+        self._concise = bool(getattr(settings, 'USE_CONCISE_RESPONSES', False))
+        self._llm_controlled = bool(getattr(settings, 'LLM_CONTROLLED_CONVERSATION', False))
+        self._llm_structured_intent = bool(getattr(settings, 'USE_LLM_STRUCTURED_INTENT', False))
+        self._state_handlers = self._build_state_handlers()
+        self._location_extractor = get_location_extractor()
         self.ai_paused = False
+        self._provs_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._dt_cache: "OrderedDict[tuple, Optional[datetime]]" = OrderedDict()
 
     # --------------------------------------------------------------------------
     # Private Helper Methods
@@ -72,19 +541,19 @@ class MessageHandler:
             safe_preview = preview.encode("ascii", errors="ignore").decode("ascii", errors="ignore")
         except Exception:
             safe_preview = preview[:80]
-        logger.info(f"[BOT RESPONSE] To: {user_number}, Type: {response_type}, Message: {safe_preview}...")
+        logger.info("[BOT RESPONSE] To: %s, Type: %s, Message: %s...", user_number, response_type, safe_preview)
         try:
             await self.whatsapp_api.send_text_message(user_number, message)
         except Exception as e:
-            logger.warning(f"Failed to send WhatsApp message to {user_number}: {e}")
+            logger.warning("Failed to send WhatsApp message to %s: %s", user_number, e)
         try:
             await self.db.store_message(user_number, "assistant", message)
         except Exception as e:
-            logger.warning(f"Could not store bot message in history for {user_number}: {e}")
+            logger.warning("Could not store bot message in history for %s: %s", user_number, e)
 
     async def _log_and_send_interactive(self, user_number: str, header: str, body: str, buttons: List[Dict], footer: str = None) -> None:
         """Log interactive response and send it to user with graceful fallback to text."""
-        logger.info(f"[BOT RESPONSE] To: {user_number}, Type: interactive_buttons, Header: {header}, Body: {body[:50]}...")
+        logger.info("[BOT RESPONSE] To: %s, Type: interactive_buttons, Header: %s, Body: %s...", user_number, header, body[:50])
         try:
             if hasattr(self.whatsapp_api, 'send_interactive_buttons'):
                 await self.whatsapp_api.send_interactive_buttons(user_number, header, body, buttons, footer)
@@ -113,7 +582,7 @@ class MessageHandler:
 
     async def _log_and_send_list(self, user_number: str, header: str, body: str, button_text: str, sections: List[Dict], footer: str = None) -> None:
         """Log interactive list response and send it. Fallback to plain text if not supported."""
-        logger.info(f"[BOT RESPONSE] To: {user_number}, Type: interactive_list, Header: {header}, Body: {body[:50]}...")
+        logger.info("[BOT RESPONSE] To: %s, Type: interactive_list, Header: %s, Body: %s...", user_number, header, body[:50])
         try:
             # Prefer a real interactive list when transport supports it
             if hasattr(self.whatsapp_api, 'send_interactive_list'):
@@ -307,11 +776,70 @@ class MessageHandler:
         except Exception:
             return False
 
+    async def _persist_session(self, user_number: str, session: Dict[str, Any]) -> None:
+        """Save the session to memory and the database.
+
+        The enum state is coerced to its string value in place for the write and
+        restored afterwards, instead of copying the whole session dict. The
+        database write is skipped when nothing but the activity timestamps
+        changed since the last write, though at least once per SESSION_CACHE_TTL
+        so the stored last_activity stays roughly current.
+        """
+        now_mono = time.monotonic()
+        self.user_sessions[user_number] = session
+        fp = _session_fingerprint(session)
+        prev = self._session_fprint.get(user_number)
+        if fp is not None and prev is not None and prev[0] == fp and now_mono - prev[1] < SESSION_CACHE_TTL:
+            return
+        state = session.get('state')
+        if isinstance(state, ConversationState):
+            session['state'] = _STATE_VALUES[state]
+        try:
+            await self.db.save_session(user_number, session)
+        finally:
+            if isinstance(state, ConversationState):
+                session['state'] = state
+        if fp is not None:
+            self._session_fprint[user_number] = (fp, now_mono)
+
+    def _forget_user(self, user_number: str) -> None:
+        """Drop everything any handler holds in memory for a number (after a reset or delete)."""
+        for handler in list(_HANDLERS):
+            handler.user_sessions.pop(user_number, None)
+            handler._session_fprint.pop(user_number, None)
+
+    async def _get_providers_cached(self, service_type: str, location: Optional[str] = None, ttl: float = PROVIDER_CACHE_TTL) -> List[Dict[str, Any]]:
+        """Providers for a service/location, served from a short-lived in-process cache.
+
+        Empty results are cached too, so sparse services don't re-query Mongo
+        on every turn. Treat the returned list as read-only.
+        """
+        key = (service_type, location or "")
+        hit = self._provs_cache.get(key)
+        if hit and time.monotonic() - hit[0] < ttl:
+            self._provs_cache.move_to_end(key)
+            return hit[1]
+        providers = await self.db.get_providers_by_service(service_type, location) or []
+        self._provs_cache[key] = (time.monotonic(), providers)
+        self._provs_cache.move_to_end(key)
+        while len(self._provs_cache) > PROVIDER_CACHE_MAX:
+            self._provs_cache.popitem(last=False)
+        return providers
+
+    def _invalidate_providers_cache(self, service_type: Optional[str] = None) -> None:
+        """Drop cached provider lookups for a service, or all of them when it is unknown."""
+        if not service_type:
+            self._provs_cache.clear()
+            return
+        svc = str(service_type).strip().lower()
+        for k in [k for k in self._provs_cache if str(k[0]).strip().lower() == svc]:
+            del self._provs_cache[k]
+
     def _fsm_state_for_session(self, session: Dict[str, Any]) -> str:
         try:
             st = session.get('state')
             if isinstance(st, ConversationState):
-                st_val = st.value
+                st_val = _STATE_VALUES[st]
             else:
                 st_val = str(st or '')
         except Exception:
@@ -345,36 +873,10 @@ class MessageHandler:
         return "collecting"
 
     def _normalize_msisdn(self, phone: str) -> Optional[str]:
-        s = re.sub(r"\D+", "", str(phone or ""))
-        if not s:
-            return None
-        if s.startswith("0") and len(s) >= 9:
-            return "263" + s[1:]
-        if s.startswith("7") and len(s) >= 9:
-            return "263" + s
-        if s.startswith("263"):
-            return s
-        if len(s) >= 9:
-            return "263" + s
-        return s
+        return normalize_msisdn(phone)
 
     def _admin_numbers(self) -> List[str]:
-        try:
-            raw = getattr(settings, 'ADMIN_WHATSAPP_NUMBERS', "") or ""
-        except Exception:
-            raw = ""
-        if isinstance(raw, (list, tuple)):
-            vals = list(raw)
-        else:
-            vals = [p.strip() for p in str(raw).replace(";", ",").split(",") if p.strip()]
-        if not vals:
-            vals = ['+263783961640', '+263775251636', '+263777530322', '+16509965727']
-        norm = []
-        for v in vals:
-            n = self._normalize_msisdn(v)
-            if n:
-                norm.append(n)
-        return list(dict.fromkeys(norm))
+        return list(ADMIN_NUMBERS_ORDERED)
 
     async def _notify_admins_new_provider(self, provider: Dict[str, Any]) -> None:
         admins = self._admin_numbers()
@@ -495,18 +997,22 @@ class MessageHandler:
         except Exception:
             return f"B{int(datetime.utcnow().timestamp()*1000)}"
 
-    async def _notify_booking_other_party(self, original_actor_number: str, booking_id: str, event: str, new_time: Optional[str] = None) -> None:
-        """Notify the other party involved in a booking about a change."""
+    async def _notify_booking_other_party(self, original_actor_number: str, booking_id: str, event: str, new_time: Optional[str] = None, booking: Optional[Dict[str, Any]] = None) -> None:
+        """Notify the other party involved in a booking about a change.
+
+        Pass ``booking`` when the caller already holds the document (e.g. it was
+        just created) to skip re-reading it from the database.
+        """
         try:
-            booking = None
-            try:
-                # Prefer explicit by-id getter when available
-                if hasattr(self.db, 'get_booking_by_id'):
-                    booking = await self.db.get_booking_by_id(booking_id)
-                elif hasattr(self.db, 'get_booking'):
-                    booking = await self.db.get_booking(booking_id)
-            except Exception:
-                booking = None
+            if booking is None:
+                try:
+                    # Prefer explicit by-id getter when available
+                    if hasattr(self.db, 'get_booking_by_id'):
+                        booking = await self.db.get_booking_by_id(booking_id)
+                    elif hasattr(self.db, 'get_booking'):
+                        booking = await self.db.get_booking(booking_id)
+                except Exception:
+                    booking = None
             if not booking:
                 return
 
@@ -558,8 +1064,12 @@ class MessageHandler:
         except Exception as e:
             logger.error(f"Failed to notify other party for booking {booking_id}: {e}")
 
-    def _resolve_provider_index_from_text(self, providers: List[Dict], text: str) -> Optional[int]:
-        """Utility to find a provider index from free-form text."""
+    def _resolve_provider_index_from_text(self, providers: List[Dict], text: str, names_lc: Optional[List[str]] = None) -> Optional[int]:
+        """Utility to find a provider index from free-form text.
+
+        ``names_lc`` are the providers' lowercased names, as stored alongside
+        the list in session data; computed here when absent or stale.
+        """
         text = (text or '').strip().lower()
         if not text or not providers:
             return None
@@ -569,23 +1079,13 @@ class MessageHandler:
             if 1 <= idx <= len(providers):
                 return idx
 
-        ordinals = {
-            'first': 1, '1st': 1, 'one': 1,
-            'second': 2, '2nd': 2, 'two': 2,
-            'third': 3, '3rd': 3, 'three': 3,
-            'fourth': 4, '4th': 4, 'four': 4,
-            'fifth': 5, '5th': 5, 'five': 5,
-        }
-        for word, idx in ordinals.items():
-            if word in text:
-                if 1 <= idx <= len(providers):
-                    return idx
+        for om in ORDINAL_RE.finditer(text):
+            idx = ORDINAL_MAP[om.group(1)]
+            if 1 <= idx <= len(providers):
+                return idx
 
         # Handle explicit button id patterns like "provider_<id>"
-        try:
-            m = re.search(r"\bprovider_([a-zA-Z0-9+_\-]+)\b", text)
-        except Exception:
-            m = None
+        m = PROVIDER_BUTTON_RE.search(text)
         if m:
             pid = m.group(1).lower()
             for i, p in enumerate(providers, start=1):
@@ -594,8 +1094,9 @@ class MessageHandler:
                     if cand and pid in cand:
                         return i
 
-        for i, p in enumerate(providers, start=1):
-            name = (p.get('name') or '').lower()
+        if not names_lc or len(names_lc) != len(providers):
+            names_lc = [(p.get('name') or '').lower() for p in providers]
+        for i, name in enumerate(names_lc, start=1):
             if name and name in text:
                 return i
 
@@ -664,48 +1165,42 @@ class MessageHandler:
     async def _log_and_send_response(self, user_number: str, message: str, response_type: str = "text") -> None:
         """Log bot response and send it to user"""
         # Some terminals on Windows can't render emojis / non-ASCII; strip them from log preview
-        preview = message[:100]
-        try:
-            safe_preview = preview.encode("ascii", errors="ignore").decode("ascii", errors="ignore")
-        except Exception:
-            safe_preview = preview[:80]
-        logger.info(f"[BOT RESPONSE] To: {user_number}, Type: {response_type}, Message: {safe_preview}...")
-
+        if logger.isEnabledFor(logging.INFO):
+            preview = message[:100]
+            safe_preview = preview if preview.isascii() else preview.encode("ascii", errors="ignore").decode("ascii")
+            logger.info("[BOT RESPONSE] To: %s, Type: %s, Message: %s...", user_number, response_type, safe_preview)
+
+        # Delivery and the history write are independent, so they run concurrently
+        sent, stored = await asyncio.gather(
+            self.whatsapp_api.send_text_message(user_number, message),
+            self.db.store_message(user_number, "assistant", message),
+            return_exceptions=True,
+        )
         # Network / Baileys errors (e.g., 404 from /send-text) should not crash the app
-        try:
-            await self.whatsapp_api.send_text_message(user_number, message)
-        except Exception as e:
-            logger.warning(f"Failed to send WhatsApp message to {user_number}: {e}")
+        if isinstance(sent, Exception):
+            logger.warning("Failed to send WhatsApp message to %s: %s", user_number, sent)
             # Do not re-raise; booking/flow logic should continue even if delivery fails
         
         # Store bot response in conversation history for context
-        try:
-            await self.db.store_message(user_number, "assistant", message)
-        except Exception as e:
-            logger.warning(f"Could not store bot message in history for {user_number}: {e}")
+        if isinstance(stored, Exception):
+            logger.warning("Could not store bot message in history for %s: %s", user_number, stored)
     
     async def _log_and_send_interactive(self, user_number: str, header: str, body: str, buttons: List[Dict], footer: str = None) -> None:
         """Log interactive response and send it to user"""
-        logger.info(f"[BOT RESPONSE] To: {user_number}, Type: interactive_buttons, Header: {header}, Body: {body[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[BOT RESPONSE] To: %s, Type: interactive_buttons, Header: %s, Body: %s...", user_number, header, body[:50])
         await self.whatsapp_api.send_interactive_buttons(user_number, header, body, buttons, footer)
     
     def _is_concise(self) -> bool:
-        try:
-            return bool(getattr(settings, 'USE_CONCISE_RESPONSES', False))
-        except Exception:
-            return False
+        return self._concise
 
     def _is_llm_controlled(self) -> bool:
-        try:
-            return bool(getattr(settings, 'LLM_CONTROLLED_CONVERSATION', False))
-        except Exception:
-            return False
+        return self._llm_controlled
 
     def _short(self, long_text: str, short_text: str) -> str:
         """Return short or long text based on concise mode. When LLM-controlled, always use long."""
-        if self._is_llm_controlled():
-            return long_text  # Always verbose for LLM mode
-        return short_text if self._is_concise() else long_text
+        # Always verbose for LLM mode
+        return long_text if self._llm_controlled or not self._concise else short_text
 
     def _pre_normalize_text(self, text: str) -> str:
         s = (text or "").strip()
@@ -727,20 +1222,17 @@ class MessageHandler:
                 hh = hh.zfill(2)
                 return f"{hh}:{mm}"
 
-            t = re.sub(r"\b(\d{3,4})\s*hrs\b", repl_compact, t, flags=re.I)
+            t = HRS_COMPACT_RE.sub(repl_compact, t)
             # 2) HH:MMhrs -> HH:MM
-            t = re.sub(r"\b(\d{1,2}):(\d{2})\s*hrs\b", r"\1:\2", t, flags=re.I)
+            t = HRS_COLON_RE.sub(r"\1:\2", t)
         except Exception:
             t = s
         # Collapse whitespace and lowercase for matching
-        t = re.sub(r"\s+", " ", t).strip().lower()
+        t = WS_RE.sub(" ", t).strip().lower()
         return t
 
     def _use_llm_structured_intent(self) -> bool:
-        try:
-            return bool(getattr(settings, 'USE_LLM_STRUCTURED_INTENT', False))
-        except Exception:
-            return False
+        return self._llm_structured_intent
 
     async def _handle_llm_structured_flow(self, user_number: str, message_text: str, session: Dict, user: Dict) -> bool:
         try:
@@ -765,7 +1257,7 @@ class MessageHandler:
         loc_raw = (slots.get('location') or '').strip()
         if loc_raw:
             try:
-                le = get_location_extractor()
+                le = self._location_extractor
                 loc_norm = le.normalize_user_location(loc_raw) or le.normalize_user_location(loc_raw.split(',')[0])
             except Exception:
                 loc_norm = None
@@ -775,13 +1267,16 @@ class MessageHandler:
         if dt_raw:
             try:
                 # Accept ISO or natural language; normalize via existing parser
-                dt = self._canonicalize_booking_time(dt_raw)
+                dt = await self._canonicalize_booking_time_async(dt_raw)
                 if dt:
-                    sd['booking_time'] = dt.strftime('%Y-%m-%d %H:%M')
+                    sd['booking_time'] = _fmt_booking_time(dt)
+                    sd['booking_time_dt'] = dt
                 else:
                     sd['booking_time'] = dt_raw
+                    sd.pop('booking_time_dt', None)
             except Exception:
                 sd['booking_time'] = dt_raw
+                sd.pop('booking_time_dt', None)
 
         if 'budget' in slots:
             sd['budget'] = slots.get('budget')
@@ -813,14 +1308,14 @@ class MessageHandler:
                 session['fsm_state'] = self._fsm_state_for_session(session)
             except Exception:
                 pass
-            if reply:
-                await self._log_and_send_response(user_number, reply, 'llm_slot_question')
+            qtext = reply or _FALLBACK_Q.get(nxt, _FALLBACK_Q['service'])
+            await self._log_and_send_response(user_number, qtext, 'llm_slot_question')
             return True
 
         svc = (sd.get('service_type') or '').strip()
         loc = (sd.get('location') or '').strip()
         if not svc:
-            await self._log_and_send_response(user_number, self._short("What service do you need? For example: plumber, electrician, cleaner.", "What service do you need?"), 'ask_service_type')
+            await self._log_and_send_response(user_number, _FALLBACK_Q['service'], 'ask_service_type')
             session['state'] = ConversationState.SERVICE_SEARCH
             return True
 
@@ -844,99 +1339,113 @@ class MessageHandler:
     def _friendly_footer(self) -> str:
         return "Reply with one or more numbers (e.g., 1 or 1, 2)" if self._is_concise() else "Tap one or more providers or reply with numbers (e.g., 1 or 1, 2) to book."
     
-    async def handle_message(self, message: WhatsAppMessage) -> None:
-        """Main message handler - routes to appropriate handlers"""
-        user_number = message.from_number
-        message_text = self._pre_normalize_text(message.text)
-        
+    async def _load_session(self, user_number: str, now_iso: str) -> Dict[str, Any]:
+        """Current session for a number, with the state coerced back to the enum."""
         # Try to load session from database first, then fall back to memory
         db_session = await self.db.get_session(user_number)
         if db_session:
             session = db_session
             # Convert state string back to enum
             if isinstance(session.get('state'), str):
-                try:
-                    session['state'] = ConversationState(session['state'])
-                except ValueError:
-                    session['state'] = ConversationState.NEW
-        else:
-            session = self.user_sessions.get(user_number, {
-                'state': ConversationState.NEW,
-                'data': {},
-                'last_activity': datetime.utcnow().isoformat()
-            })
+                session['state'] = _STATE_BY_VALUE.get(session['state'], ConversationState.NEW)
+            return session
+        return self.user_sessions.get(user_number, {
+            'state': ConversationState.NEW,
+            'data': {},
+            'last_activity': now_iso
+        })
+
+    async def handle_message(self, message: WhatsAppMessage) -> None:
+        """Main message handler - routes to appropriate handlers"""
+        user_number = message.from_number
+        message_text = self._pre_normalize_text(message.text)
+        # One clock read per inbound message, reused for every timestamp below
+        now = datetime.utcnow()
+        now_iso = now.isoformat()
+        now_ts = time.time()
         
-        # Get user from database
-        user = await self.db.get_user(user_number)
+        # Session, user and history write are independent; run them concurrently
+        session, user, stored = await asyncio.gather(
+            self._load_session(user_number, now_iso),
+            self.db.get_user(user_number),
+            self.db.store_message(user_number, "user", message_text),
+            return_exceptions=True,
+        )
+        if isinstance(session, BaseException):
+            raise session
+        if isinstance(user, BaseException):
+            raise user
         
         # Store user message in conversation history for context
-        try:
-            await self.db.store_message(user_number, "user", message_text)
-        except Exception as e:
-            logger.warning(f"Could not store user message in history for {user_number}: {e}")
+        if isinstance(stored, Exception):
+            logger.warning(f"Could not store user message in history for {user_number}: {stored}")
         
         # Optional LLM-structured intent mode: delegate slot-filling to Bedrock
         try:
             if self._use_llm_structured_intent():
                 handled = await self._handle_llm_structured_flow(user_number, message_text, session, user or {})
                 if handled:
-                    session['last_activity'] = datetime.utcnow().isoformat()
+                    session['last_activity'] = now_iso
+                    session['last_activity_ts'] = now_ts
                     try:
                         session['fsm_state'] = self._fsm_state_for_session(session)
                     except Exception:
                         pass
-                    session_to_save = session.copy()
-                    if isinstance(session_to_save.get('state'), ConversationState):
-                        session_to_save['state'] = session_to_save['state'].value
-                    self.user_sessions[user_number] = session
-                    await self.db.save_session(user_number, session_to_save)
+                    await self._persist_session(user_number, session)
                     return
         except Exception:
             pass
         
         expired = False
-        try:
-            la_raw = session.get('last_activity')
-            if la_raw:
-                last_dt = du_parse(la_raw)
-                if datetime.utcnow() - last_dt > timedelta(hours=24):
-                    expired = True
-        except Exception:
-            expired = False
+        la_ts = session.get('last_activity_ts')
+        if isinstance(la_ts, (int, float)):
+            # Epoch seconds written alongside the ISO string; no parsing needed
+            expired = now_ts - la_ts > SESSION_EXPIRY_SECONDS
+        else:
+            # Sessions saved before last_activity_ts existed
+            try:
+                la_raw = session.get('last_activity')
+                if la_raw:
+                    # last_activity is written as isoformat(); skip dateutil for it
+                    try:
+                        last_dt = datetime.fromisoformat(la_raw)
+                    except (TypeError, ValueError):
+                        last_dt = du_parse(la_raw)
+                    if now - last_dt > timedelta(seconds=SESSION_EXPIRY_SECONDS):
+                        expired = True
+            except Exception:
+                expired = False
         if expired:
             session['state'] = ConversationState.SERVICE_SEARCH if (user and user.get('onboarding_completed', False)) else ConversationState.NEW
             session['data'] = {}
-        if message_text in {'hi', 'hello', 'hey', 'start', 'menu'}:
+        if message_text in GREETING_WORDS:
             session['state'] = ConversationState.SERVICE_SEARCH if (user and user.get('onboarding_completed', False)) else ConversationState.NEW
             if session['state'] == ConversationState.SERVICE_SEARCH:
                 session['data'] = {}
                 await self._log_and_send_response(
                     user_number,
-                    self._short("What service do you need? For example: plumber, electrician, cleaner.", "What service do you need?"),
+                    _FALLBACK_Q['service'],
                     "session_reset"
                 )
-                session['last_activity'] = datetime.utcnow().isoformat()
+                session['last_activity'] = now_iso
+                session['last_activity_ts'] = now_ts
                 # FSM veneer for observability
                 try:
                     session['fsm_state'] = self._fsm_state_for_session(session)
                 except Exception:
                     pass
-                session_to_save = session.copy()
-                if isinstance(session_to_save.get('state'), ConversationState):
-                    session_to_save['state'] = session_to_save['state'].value
-                self.user_sessions[user_number] = session
-                await self.db.save_session(user_number, session_to_save)
+                await self._persist_session(user_number, session)
                 return
 
         # Exit/pause: gracefully end/neutralize the session on polite closures
         try:
             is_exit = False
             is_pause = False
-            if message_text in {"thanks", "thank you", "ok thanks", "okay thanks", "bye", "goodbye", "cheers", "no thanks", "done", "that's all", "thats all"}:
+            if message_text in EXIT_PHRASES:
                 is_exit = True
-            elif re.fullmatch(r"\s*(ok(ay)?\s+)?(thanks|thank you)[\w\s\.!]*\s*", message_text or ""):
+            elif THANKS_RE.fullmatch(message_text or ""):
                 is_exit = True
-            elif any(kw in (message_text or '') for kw in ["not now", "later", "maybe later", "not yet"]):
+            elif PAUSE_RE.search(message_text or ''):
                 is_pause = True
             if is_exit:
                 await self._log_and_send_response(
@@ -946,7 +1455,8 @@ class MessageHandler:
                 )
                 session['state'] = ConversationState.SERVICE_SEARCH if (user and user.get('onboarding_completed', False)) else ConversationState.NEW
                 session['data'] = {}
-                session['last_activity'] = datetime.utcnow().isoformat()
+                session['last_activity'] = now_iso
+                session['last_activity_ts'] = now_ts
                 # FSM veneer override to mark a cancellation event
                 try:
                     session.setdefault('data', {})['_fsm_state_override'] = 'cancelled'
@@ -957,11 +1467,7 @@ class MessageHandler:
                     session['fsm_state'] = self._fsm_state_for_session(session)
                 except Exception:
                     pass
-                session_to_save = session.copy()
-                if isinstance(session_to_save.get('state'), ConversationState):
-                    session_to_save['state'] = session_to_save['state'].value
-                self.user_sessions[user_number] = session
-                await self.db.save_session(user_number, session_to_save)
+                await self._persist_session(user_number, session)
                 return
             if is_pause:
                 await self._log_and_send_response(
@@ -971,17 +1477,14 @@ class MessageHandler:
                 )
                 session['state'] = ConversationState.SERVICE_SEARCH if (user and user.get('onboarding_completed', False)) else ConversationState.NEW
                 session['data'] = {}
-                session['last_activity'] = datetime.utcnow().isoformat()
+                session['last_activity'] = now_iso
+                session['last_activity_ts'] = now_ts
                 # FSM veneer for observability
                 try:
                     session['fsm_state'] = self._fsm_state_for_session(session)
                 except Exception:
                     pass
-                session_to_save = session.copy()
-                if isinstance(session_to_save.get('state'), ConversationState):
-                    session_to_save['state'] = session_to_save['state'].value
-                self.user_sessions[user_number] = session
-                await self.db.save_session(user_number, session_to_save)
+                await self._persist_session(user_number, session)
                 return
         except Exception:
             pass
@@ -994,55 +1497,14 @@ class MessageHandler:
             await self.handle_main_menu(user_number, message_text, session, user or {})
         elif not user or not user.get('onboarding_completed', False):
             await self.handle_onboarding(user_number, message_text, session)
-        elif current_state == ConversationState.BOOKING_LOCATION:
-            await self.handle_booking_location(user_number, message_text, session, user)
-        elif current_state == ConversationState.BOOKING_DATE:
-            await self.handle_booking_date(user_number, message_text, session, user)
-        elif current_state == ConversationState.BOOKING_TIME:
-            await self.handle_booking_time(user_number, message_text, session, user)
-        elif current_state == ConversationState.BOOKING_BUDGET:
-            await self.handle_booking_budget(user_number, message_text, session, user)
-        elif current_state == ConversationState.BOOKING_USER_NAME:
-            await self.handle_booking_user_name(user_number, message_text, session, user)
-        elif current_state == ConversationState.BOOKING_CONFIRM:
-            await self.handle_booking_confirm(user_number, message_text, session, user)
-        elif current_state == ConversationState.PROVIDER_SELECTION:
-            try:
-                handled = await self._maybe_quick_provider_choice(user_number, message_text, session, user)
-                if not handled:
-                    await self._log_and_send_response(user_number, "Please reply with the number of a provider from the list.", "provider_select_repeat")
-            except Exception:
-                await self._log_and_send_response(user_number, "Please reply with the number of a provider from the list.", "provider_select_repeat")
-        elif current_state == ConversationState.CANCEL_EXISTING_BOOKING_CONFIRM:
-            await self.handle_cancel_existing_booking_confirm(user_number, message_text, session, user or {})
-        elif current_state == ConversationState.CANCEL_BOOKING_SELECT:
-            await self.handle_cancel_booking_select(user_number, message_text, session, user or {})
-        elif current_state == ConversationState.CANCEL_BOOKING_CONFIRM:
-            await self.handle_cancel_booking_select(user_number, message_text, session, user or {})
-        elif current_state == ConversationState.VIEW_BOOKINGS:
-            await self.handle_view_bookings_state(user_number, message_text, session, user)
-        elif current_state == ConversationState.RESCHEDULE_BOOKING_SELECT:
-            await self.handle_reschedule_booking_select(user_number, message_text, session, user or {})
-        elif current_state == ConversationState.RESCHEDULE_BOOKING_NEW_TIME:
-            await self.handle_reschedule_booking_new_time(user_number, message_text, session, user or {})
-        elif current_state == ConversationState.RESCHEDULE_BOOKING_CONFIRM:
-            await self.handle_reschedule_booking_confirm(user_number, message_text, session, user or {})
-        elif current_state in {
-            ConversationState.PROVIDER_REGISTER,
-            ConversationState.PROVIDER_REGISTER_NAME,
-            ConversationState.PROVIDER_REGISTER_SERVICE,
-            ConversationState.PROVIDER_REGISTER_LOCATION,
-            ConversationState.PROVIDER_REGISTER_BUSINESS,
-            ConversationState.PROVIDER_REGISTER_CONTACT,
-        }:
-            await self.handle_provider_registration(user_number, message_text, session)
-        elif current_state == ConversationState.NO_PROVIDERS_OPTIONS:
-            await self.handle_no_providers_options(user_number, message_text, session, user)
         else:
-            await self.handle_main_menu(user_number, message_text, session, user)
+            # Onboarded users: one lookup picks the state's handler (main menu by default)
+            handler = self._state_handlers.get(current_state, self.handle_main_menu)
+            await handler(user_number, message_text, session, user)
         
         # Update session in both memory and database
-        session['last_activity'] = datetime.utcnow().isoformat()
+        session['last_activity'] = now_iso
+        session['last_activity_ts'] = now_ts
         # FSM veneer for observability
         try:
             session['fsm_state'] = self._fsm_state_for_session(session)
@@ -1055,13 +1517,50 @@ class MessageHandler:
                 session['fsm_state'] = ovr
         except Exception:
             pass
-        # Convert ConversationState enum to string for database storage
-        session_to_save = session.copy()
-        if isinstance(session_to_save.get('state'), ConversationState):
-            session_to_save['state'] = session_to_save['state'].value
-        self.user_sessions[user_number] = session
-        await self.db.save_session(user_number, session_to_save)
+        await self._persist_session(user_number, session)
     
+    def _build_state_handlers(self) -> Dict[ConversationState, Any]:
+        """Handlers for onboarded users, keyed by conversation state."""
+        S = ConversationState
+        handlers = {
+            S.BOOKING_LOCATION: self.handle_booking_location,
+            S.BOOKING_DATE: self.handle_booking_date,
+            S.BOOKING_TIME: self.handle_booking_time,
+            S.BOOKING_BUDGET: self.handle_booking_budget,
+            S.BOOKING_USER_NAME: self.handle_booking_user_name,
+            S.BOOKING_CONFIRM: self.handle_booking_confirm,
+            S.PROVIDER_SELECTION: self._handle_provider_selection_state,
+            S.CANCEL_EXISTING_BOOKING_CONFIRM: self.handle_cancel_existing_booking_confirm,
+            S.CANCEL_BOOKING_SELECT: self.handle_cancel_booking_select,
+            S.CANCEL_BOOKING_CONFIRM: self.handle_cancel_booking_select,
+            S.VIEW_BOOKINGS: self.handle_view_bookings_state,
+            S.RESCHEDULE_BOOKING_SELECT: self.handle_reschedule_booking_select,
+            S.RESCHEDULE_BOOKING_NEW_TIME: self.handle_reschedule_booking_new_time,
+            S.RESCHEDULE_BOOKING_CONFIRM: self.handle_reschedule_booking_confirm,
+            S.NO_PROVIDERS_OPTIONS: self.handle_no_providers_options,
+        }
+        for st in (
+            S.PROVIDER_REGISTER,
+            S.PROVIDER_REGISTER_NAME,
+            S.PROVIDER_REGISTER_SERVICE,
+            S.PROVIDER_REGISTER_LOCATION,
+            S.PROVIDER_REGISTER_BUSINESS,
+            S.PROVIDER_REGISTER_CONTACT,
+        ):
+            handlers[st] = self._handle_provider_registration_state
+        return handlers
+
+    async def _handle_provider_selection_state(self, user_number: str, message_text: str, session: Dict, user: Dict) -> None:
+        try:
+            handled = await self._maybe_quick_provider_choice(user_number, message_text, session, user)
+            if not handled:
+                await self._log_and_send_response(user_number, "Please reply with the number of a provider from the list.", "provider_select_repeat")
+        except Exception:
+            await self._log_and_send_response(user_number, "Please reply with the number of a provider from the list.", "provider_select_repeat")
+
+    async def _handle_provider_registration_state(self, user_number: str, message_text: str, session: Dict, user: Dict) -> None:
+        await self.handle_provider_registration(user_number, message_text, session)
+
     async def handle_onboarding(self, user_number: str, message_text: str, session: Dict) -> None:
         """Handle new user onboarding flow"""
         state = session['state']
@@ -1083,7 +1582,7 @@ class MessageHandler:
         elif state == ConversationState.ONBOARDING_NAME:
             # Collect name and location from a single message
             raw = message_text.strip()
-            parts = re.split(r'[,\n\-]+', raw)
+            parts = NAME_LOC_SPLIT_RE.split(raw)
             parts = [p.strip() for p in parts if p.strip()]
             
             if len(parts) >= 2:
@@ -1091,14 +1590,15 @@ class MessageHandler:
                 location_raw = parts[1]
                 # Normalize user location so suburbs/towns map to the
                 # nearest known service area (e.g. Aspindale -> Harare).
-                location_extractor = get_location_extractor()
+                location_extractor = self._location_extractor
                 normalized_location = location_extractor.normalize_user_location(location_raw)
                 if normalized_location:
                     location = normalized_location
                 else:
                     location = location_raw.title()
-                session['data']['name'] = name
-                session['data']['location'] = location
+                sd = session.setdefault('data', {})
+                sd['name'] = name
+                sd['location'] = location
             else:
                 # If we can't clearly extract both, ask once more with an example
                 await self._log_and_send_response(
@@ -1128,12 +1628,13 @@ class MessageHandler:
         
         elif state == ConversationState.ONBOARDING_PRIVACY:
             # Handle privacy agreement
-            if message_text in ['yes', 'y', 'agree', 'ok', 'sure']:
+            if message_text in PRIVACY_AGREE_WORDS:
                 # Record core consent flags and proceed to email collection
-                session['data']['agreed_privacy_policy'] = True
-                session['data']['consent_transactional'] = True
-                session['data']['consent_marketing'] = False
-                session['data']['consent_timestamp'] = datetime.utcnow().isoformat()
+                sd = session.setdefault('data', {})
+                sd['agreed_privacy_policy'] = True
+                sd['consent_transactional'] = True
+                sd['consent_marketing'] = False
+                sd['consent_timestamp'] = datetime.utcnow().isoformat()
 
                 await self._log_and_send_response(
                     user_number,
@@ -1160,9 +1661,9 @@ class MessageHandler:
             # Optional email collection (allow 'skip')
             text = (message_text or '').strip()
             email = None
-            if text.lower() not in ['skip', 'no', 'none', 'na', 'n/a', '']:
+            if text.lower() not in SKIP_WORDS:
                 # Very light validation
-                if re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", text):
+                if EMAIL_RE.match(text):
                     email = text
                 else:
                     await self._log_and_send_response(
@@ -1191,12 +1692,10 @@ class MessageHandler:
         elif state == ConversationState.ONBOARDING_PREFERENCES:
             text = (message_text or '').strip().lower()
             prefs: List[str] = []
-            if text not in ['skip', 'no', 'none', 'na', 'n/a', '']:
-                # Reuse service keyword mapping from extract_service_type
-                services_map = self.extract_service_type(text, return_map=True)
-                for keyword, service in services_map.items():
-                    if keyword in text and service not in prefs:
-                        prefs.append(service)
+            if text not in SKIP_WORDS:
+                # Same keywords as extract_service_type; skip the full pass when none match
+                if SERVICE_KEYWORD_RE.search(text):
+                    prefs = list(dict.fromkeys(svc for kw, svc in SERVICE_KEYWORDS.items() if kw in text))
 
                 if not prefs:
                     await self._log_and_send_response(
@@ -1239,15 +1738,15 @@ class MessageHandler:
         if text in {"help", "/help", "?"}:
             await self.send_help_menu(user_number)
             return
-        if any(k in text for k in ["my bookings", "view bookings", "bookings"]):
+        if "bookings" in text:
             await self.show_user_bookings(user_number, session, user, mode="view")
             session['state'] = ConversationState.VIEW_BOOKINGS
             return
-        if any(k in text for k in ["cancel booking", "cancel a booking", "cancel"]):
+        if "cancel" in text:
             await self.show_user_bookings(user_number, session, user, mode="cancel")
             session['state'] = ConversationState.CANCEL_BOOKING_SELECT
             return
-        if any(k in text for k in ["reschedule", "change time", "move booking", "reschedule booking"]):
+        if MENU_RESCHEDULE_RE.search(text):
             await self.show_user_bookings(user_number, session, user, mode="reschedule")
             session['state'] = ConversationState.RESCHEDULE_BOOKING_SELECT
             return
@@ -1262,7 +1761,7 @@ class MessageHandler:
 
         # Policy/compensation questions: inform directly instead of ASK
         try:
-            if re.search(r"\b(compensat|refund|pay\s*back|liabilit(y|ies)|policy)\b", text):
+            if POLICY_QUESTION_RE.search(text):
                 msg = (
                     "Hustlr connects you with independent providers. Payments are usually made directly to the provider. "
                     "Hustlr does not guarantee service outcomes and is not liable for disputes between users and providers. "
@@ -1279,8 +1778,8 @@ class MessageHandler:
                 session.setdefault('data', {})['service_type'] = svc
                 # Try using user's saved location if it maps to an available area
                 try:
-                    loc_ex = get_location_extractor()
-                    providers_for_service = await self.db.get_providers_by_service(svc)
+                    loc_ex = self._location_extractor
+                    providers_for_service = await self._get_providers_cached(svc)
                     available_locations = loc_ex.get_available_locations_for_service(providers_for_service or [])
                 except Exception:
                     available_locations = []
@@ -1337,16 +1836,8 @@ class MessageHandler:
 
                 if available_locations:
                     # Present only locations where we actually have providers
-                    rows = [{"id": f"loc_{i+1}", "title": loc} for i, loc in enumerate(available_locations[:10])]
-                    sections = [{"title": "Available areas", "rows": rows}]
                     body = "Choose your area to see available providers."
-                    await self._log_and_send_list(user_number, f"{svc.title()} near you", body, "Select area", sections, None)
-                    # Remember choices for numeric/id replies
-                    try:
-                        session.setdefault('data', {})['_available_locations'] = available_locations[:10]
-                    except Exception:
-                        pass
-                    session['state'] = ConversationState.BOOKING_LOCATION
+                    await self._send_location_choices(user_number, f"{svc.title()} near you", body, available_locations, session)
                     return
 
                 # Fallback: ask for free-text location
@@ -1360,15 +1851,28 @@ class MessageHandler:
         # Default: let AI parse and drive next action
         await self.handle_ai_response(user_number, message_text, session, user)
 
+    async def _send_location_choices(self, user_number: str, header: str, body: str, available_locations: List[str], session: Dict) -> None:
+        """Send areas with providers as a list and wait for the user's pick."""
+        choices = available_locations[:10]
+        rows = [{"id": rid, "title": loc} for rid, loc in zip(_LOC_ROW_IDS, choices)]
+        sections = [{"title": "Available areas", "rows": rows}]
+        await self._log_and_send_list(user_number, header, body, "Select area", sections, None)
+        # Remember choices for numeric/id replies
+        try:
+            session.setdefault('data', {})['_available_locations'] = choices
+        except Exception:
+            pass
+        session['state'] = ConversationState.BOOKING_LOCATION
+
     async def handle_booking_location(self, user_number: str, message_text: str, session: Dict, user: Dict) -> None:
         raw = (message_text or '').strip()
-        loc_ex = get_location_extractor()
+        loc_ex = self._location_extractor
         norm = None
         # Build available locations for the selected service to enable fuzzy matching
         available_locations: List[str] = []
         try:
             svc = (session.get('data') or {}).get('service_type') or ''
-            providers_for_service = await self.db.get_providers_by_service(svc) if svc else []
+            providers_for_service = await self._get_providers_cached(svc) if svc else []
             available_locations = loc_ex.get_available_locations_for_service(providers_for_service or [])
         except Exception:
             available_locations = []
@@ -1408,21 +1912,13 @@ class MessageHandler:
         if not norm:
             try:
                 svc = (session.get('data') or {}).get('service_type') or ''
-                providers_for_service = await self.db.get_providers_by_service(svc)
+                providers_for_service = await self._get_providers_cached(svc)
                 available_locations = loc_ex.get_available_locations_for_service(providers_for_service or [])
             except Exception:
                 available_locations = []
             if available_locations:
-                rows = [{"id": f"loc_{i+1}", "title": loc} for i, loc in enumerate(available_locations[:10])]
-                sections = [{"title": "Available areas", "rows": rows}]
                 body = "Please pick one of the areas where we currently have providers."
-                await self._log_and_send_list(user_number, "Where are you located?", body, "Select area", sections, None)
-                # Remember choices for numeric/id replies
-                try:
-                    session.setdefault('data', {})['_available_locations'] = available_locations[:10]
-                except Exception:
-                    pass
-                session['state'] = ConversationState.BOOKING_LOCATION
+                await self._send_location_choices(user_number, "Where are you located?", body, available_locations, session)
                 return
         loc_store = norm or raw.title()
         session.setdefault('data', {})['location'] = loc_store
@@ -1443,14 +1939,15 @@ class MessageHandler:
         # If user provided both date and time (e.g., "tomorrow 12:00"), capture both now
         dt = None
         try:
-            dt = self._canonicalize_booking_time(date_text)
+            dt = await self._canonicalize_booking_time_async(date_text)
         except Exception:
             dt = None
         if dt:
-            iso = dt.strftime('%Y-%m-%d %H:%M')
+            iso = _fmt_booking_time(dt)
             sd = session.setdefault('data', {})
             sd['date'] = dt.strftime('%Y-%m-%d')
             sd['booking_time'] = iso
+            sd['booking_time_dt'] = dt
             await self._log_and_send_response(user_number, f"Perfect 👍 {iso}.\n\nDo you have a budget in mind?\n(You can say 'skip' if you’re not sure)", "ask_booking_budget")
             session['state'] = ConversationState.BOOKING_BUDGET
             return
@@ -1464,14 +1961,16 @@ class MessageHandler:
         combo = f"{date_part} {message_text}".strip()
         dt = None
         try:
-            dt = self._canonicalize_booking_time(combo)
+            dt = await self._canonicalize_booking_time_async(combo)
         except Exception:
             dt = None
         if not dt:
             await self._log_and_send_response(user_number, "I couldn't understand that time. Try '9am' or '14:00'.", "booking_time_invalid_simple")
             return
-        iso = dt.strftime('%Y-%m-%d %H:%M')
-        session.setdefault('data', {})['booking_time'] = iso
+        iso = _fmt_booking_time(dt)
+        sd = session.setdefault('data', {})
+        sd['booking_time'] = iso
+        sd['booking_time_dt'] = dt
         await self._log_and_send_response(user_number, f"Perfect 👍 {iso}.\n\nDo you have a budget in mind?\n(You can say 'skip' if you’re not sure)", "ask_booking_budget")
         session['state'] = ConversationState.BOOKING_BUDGET
 
@@ -1562,60 +2061,30 @@ class MessageHandler:
         await self._log_and_send_response(user_number, "Please reply Yes to proceed, or say what to change: location, date, time, or budget.", "booking_confirm_repeat")
 
     def _normalize_msisdn(self, phone: str) -> Optional[str]:
-        s = re.sub(r"\D+", "", str(phone or ""))
-        if not s:
-            return None
-        if s.startswith("0") and len(s) >= 9:
-            return "263" + s[1:]
-        if s.startswith("7") and len(s) >= 9:
-            return "263" + s
-        if s.startswith("263"):
-            return s
-        if len(s) >= 9:
-            return "263" + s
-        return s
+        return normalize_msisdn(phone)
 
     def _admin_numbers(self) -> List[str]:
-        try:
-            raw = getattr(settings, 'ADMIN_WHATSAPP_NUMBERS', "") or ""
-        except Exception:
-            raw = ""
-        if isinstance(raw, (list, tuple)):
-            vals = list(raw)
-        else:
-            vals = [p.strip() for p in str(raw).replace(";", ",").split(",") if p.strip()]
-        if not vals:
-            vals = ['+263783961640', '+263775251636', '+263777530322', '+16509965727']
-        norm = []
-        for v in vals:
-            n = self._normalize_msisdn(v)
-            if n:
-                norm.append(n)
-        return list(dict.fromkeys(norm))
+        return list(ADMIN_NUMBERS_ORDERED)
 
     async def _notify_admins_new_provider(self, provider: Dict[str, Any]) -> None:
-        admins = self._admin_numbers()
+        admins = ADMIN_NUMBERS_ORDERED
         if not admins:
             return
-        name = provider.get('name') or ''
-        svc = provider.get('service_type') or ''
-        loc = provider.get('location') or ''
         phone = provider.get('whatsapp_number') or provider.get('contact') or ''
-        phone_norm = self._normalize_msisdn(phone) or phone
-        lines = [
-            f"New provider registration",
-            f"Name: {name}",
-            f"Service: {svc}",
-            f"Location: {loc}",
-            f"Phone: {phone_norm}",
-            "Reply APPROVE <number> to approve, or DENY <number> to reject.",
-        ]
-        body = "\n".join(lines)
-        for a in admins:
-            try:
-                await self._log_and_send_response(a, body, "admin_new_provider")
-            except Exception:
-                pass
+        body = NEW_PROVIDER_ADMIN_TMPL.format_map({
+            'name': provider.get('name') or '',
+            'service_type': provider.get('service_type') or '',
+            'location': provider.get('location') or '',
+            'phone': self._normalize_msisdn(phone) or phone,
+        })
+        # Independent sends; overlap them instead of paying one round-trip per admin
+        results = await asyncio.gather(
+            *(self._log_and_send_response(a, body, "admin_new_provider") for a in admins),
+            return_exceptions=True,
+        )
+        for a, res in zip(admins, results):
+            if isinstance(res, Exception):
+                logger.warning("New-provider notice to admin %s failed: %s", a, res)
 
     async def handle_provider_registration(self, user_number: str, message_text: str, session: Dict) -> None:
         state = session.get('state')
@@ -1697,12 +2166,10 @@ class MessageHandler:
             }
             ok = await self.db.create_provider(doc)
             if ok:
+                self._invalidate_providers_cache(doc['service_type'])
                 await self._log_and_send_response(user_number, self._short("Registration received. We'll review and notify you soon.", "Registration submitted. We'll notify you."), "provider_registration_complete")
-                try:
-                    prov = await self.db.get_provider_by_phone(doc['whatsapp_number'])
-                except Exception:
-                    prov = doc
-                await self._notify_admins_new_provider(prov or doc)
+                # The notice only needs fields we just wrote; no need to read the provider back
+                await self._notify_admins_new_provider(doc)
                 session['state'] = ConversationState.SERVICE_SEARCH
                 sd.pop('_prov_reg', None)
                 return
@@ -1712,14 +2179,13 @@ class MessageHandler:
             return
 
     async def handle_admin_approval(self, user_number: str, message_text: str, session: Dict) -> None:
-        admins = set(self._admin_numbers())
         actor = self._normalize_msisdn(user_number)
-        if actor not in admins:
+        if actor not in ADMIN_NUMBERS:
             await self._log_and_send_response(user_number, "You are not authorized to approve providers.", "admin_not_authorized")
             return
         text = (message_text or '').strip().lower()
         action = None
-        m = re.match(r"^\s*(approve|deny)\s+(.+)$", text)
+        m = ADMIN_CMD_RE.match(text)
         if m:
             action = m.group(1)
             num_raw = m.group(2)
@@ -1740,34 +2206,24 @@ class MessageHandler:
             return
         if action == 'approve':
             await self.db.update_provider_status(prov_id, 'active')
+            self._invalidate_providers_cache(prov.get('service_type'))
             await self._log_and_send_response(user_number, f"Approved {prov.get('name')} ({target_num}).", "admin_approved")
-            try:
-                await self._log_and_send_response(target_num, "Your provider registration has been approved. You are now listed and can receive bookings.", "provider_approved")
-            except Exception:
-                pass
-            others = [a for a in admins if a != actor]
+            sends = [
+                self._log_and_send_response(target_num, "Your provider registration has been approved. You are now listed and can receive bookings.", "provider_approved"),
+            ]
             note = f"Provider approved: {prov.get('name')} — {prov.get('service_type')} — {target_num} (by {actor})."
-            for a in others:
-                try:
-                    await self._log_and_send_response(a, note, "admin_approval_broadcast")
-                except Exception:
-                    pass
-            return
         else:
             await self.db.update_provider_status(prov_id, 'rejected')
+            self._invalidate_providers_cache(prov.get('service_type'))
             await self._log_and_send_response(user_number, f"Rejected {prov.get('name')} ({target_num}).", "admin_rejected")
-            try:
-                await self._log_and_send_response(target_num, "Your provider registration has been rejected. You may reply REGISTER to try again.", "provider_rejected")
-            except Exception:
-                pass
-            others = [a for a in admins if a != actor]
+            sends = [
+                self._log_and_send_response(target_num, "Your provider registration has been rejected. You may reply REGISTER to try again.", "provider_rejected"),
+            ]
             note = f"Provider rejected: {prov.get('name')} — {prov.get('service_type')} — {target_num} (by {actor})."
-            for a in others:
-                try:
-                    await self._log_and_send_response(a, note, "admin_approval_broadcast")
-                except Exception:
-                    pass
-            return
+        sends.extend(self._log_and_send_response(a, note, "admin_approval_broadcast") for a in ADMIN_NUMBERS - {actor})
+        # The acting admin already has their reply; fan the rest out off the request path
+        for coro in sends:
+            _spawn_background(coro, "admin approval notification")
 
     async def handle_admin_commands(self, user_number: str, message_text: str, session: Dict) -> None:
         actor = self._normalize_msisdn(user_number)
@@ -1809,7 +2265,7 @@ class MessageHandler:
             token = arg_after('/provider')
             token = token.split()[0] if token else ''
             prov = None
-            if re.fullmatch(r"[0-9a-f]{24}", token):
+            if OBJECT_ID_RE.fullmatch(token):
                 prov = await self.db.get_provider_by_id(token)
             else:
                 pn = self._normalize_msisdn(token)
@@ -1826,7 +2282,7 @@ class MessageHandler:
             token = arg_after('/'+action+' provider')
             token = token.split()[0] if token else ''
             prov = None
-            if re.fullmatch(r"[0-9a-f]{24}", token):
+            if OBJECT_ID_RE.fullmatch(token):
                 prov = await self.db.get_provider_by_id(token)
             else:
                 pn = self._normalize_msisdn(token)
@@ -1838,6 +2294,7 @@ class MessageHandler:
             pid = str(prov.get('_id'))
             if action == 'approve' or action == 'reinstate':
                 await self.db.update_provider_status(pid, 'active')
+                self._invalidate_providers_cache(prov.get('service_type'))
                 await send(f"Provider approved: {prov.get('name')} ({prov.get('whatsapp_number')}).", "admin_approved")
                 try:
                     await self._log_and_send_response(prov.get('whatsapp_number'), "Your provider account is now active.", "provider_approved")
@@ -1845,6 +2302,7 @@ class MessageHandler:
                     pass
             elif action == 'reject':
                 await self.db.update_provider_status(pid, 'rejected')
+                self._invalidate_providers_cache(prov.get('service_type'))
                 await send(f"Provider rejected: {prov.get('name')}.")
                 try:
                     await self._log_and_send_response(prov.get('whatsapp_number'), "Your provider registration was rejected.", "provider_rejected")
@@ -1852,6 +2310,7 @@ class MessageHandler:
                     pass
             elif action == 'suspend' or action == 'blacklist':
                 await self.db.update_provider_status(pid, 'blacklisted' if action=='blacklist' else 'suspended')
+                self._invalidate_providers_cache(prov.get('service_type'))
                 await send(f"Provider {action}ed: {prov.get('name')}.")
             return
 
@@ -1861,7 +2320,7 @@ class MessageHandler:
             token = parts[0] if parts else ''
             fields_text = rest[len(token):].strip()
             prov = None
-            if re.fullmatch(r"[0-9a-f]{24}", token):
+            if OBJECT_ID_RE.fullmatch(token):
                 prov = await self.db.get_provider_by_id(token)
             else:
                 pn = self._normalize_msisdn(token)
@@ -1877,6 +2336,8 @@ class MessageHandler:
                 await send("No fields provided.")
                 return
             ok = await self.db.update_provider_fields(str(prov.get('_id')), updates)
+            # Edits may move the provider to another service; drop everything
+            self._invalidate_providers_cache()
             await send("Updated." if ok else "No change.")
             return
 
@@ -1909,10 +2370,10 @@ class MessageHandler:
         if low.startswith('/assign booking') or low.startswith('/reassign booking'):
             bid = arg_after('/assign booking' if low.startswith('/assign') else '/reassign booking').split()[0]
             pv = None
-            m = re.search(r"provider\s+([\w\+\-]+)$", text, re.I)
+            m = ADMIN_PROVIDER_ARG_RE.search(text)
             token = m.group(1) if m else ''
             prov = None
-            if re.fullmatch(r"[0-9a-f]{24}", token):
+            if OBJECT_ID_RE.fullmatch(token):
                 prov = await self.db.get_provider_by_id(token)
             else:
                 pn = self._normalize_msisdn(token)
@@ -1932,7 +2393,7 @@ class MessageHandler:
 
         if low.startswith('/cancel booking'):
             bid = arg_after('/cancel booking').split()[0]
-            m = re.search(r"reason=\"([^\"]*)\"", text)
+            m = ADMIN_REASON_RE.search(text)
             reason = m.group(1) if m else ''
             ok = await self.db.update_booking_fields(bid, {'status': 'cancelled', 'cancel_reason': reason})
             if ok:
@@ -1974,6 +2435,7 @@ class MessageHandler:
                 return
             await self.db.delete_session(msisdn)
             await self.db.delete_conversation_history(msisdn)
+            self._forget_user(msisdn)
             await send("Conversation reset.")
             return
 
@@ -2109,7 +2571,7 @@ class MessageHandler:
                     text = inner
             msg = None
             try:
-                payload = json.loads(text)
+                payload = _loads_json(text)
                 if isinstance(payload, dict):
                     msg = (payload.get("assistantMessage") or "").strip()
             except Exception:
@@ -2183,7 +2645,7 @@ class MessageHandler:
                     inner = inner[4:].lstrip('\n\r ')
                 text = inner
         try:
-            payload = json.loads(text)
+            payload = _loads_json(text)
         except Exception:
             # Treat as plain advice if not JSON
             await self._log_and_send_response(user_number, text, "admin_ai_plain")
@@ -2300,7 +2762,7 @@ class MessageHandler:
         async def _find_provider(token: str) -> Optional[Dict[str, Any]]:
             if not token:
                 return None
-            if re.fullmatch(r"[0-9a-f]{24}", token):
+            if OBJECT_ID_RE.fullmatch(token):
                 return await self.db.get_provider_by_id(token)
             pn = self._normalize_msisdn(token)
             return await self.db.get_provider_by_phone(pn) if pn else None
@@ -2325,6 +2787,7 @@ class MessageHandler:
             pid = str(prov.get('_id'))
             if t in {'PROVIDER_APPROVE','PROVIDER_REINSTATE'}:
                 ok = await self.db.update_provider_status(pid, 'active')
+                self._invalidate_providers_cache(prov.get('service_type'))
                 if ok:
                     try:
                         await self._log_and_send_response(prov.get('whatsapp_number'), "Your provider account is now active.", "provider_approved")
@@ -2333,6 +2796,7 @@ class MessageHandler:
                 return ok, f"Provider approved: {prov.get('name')}"
             if t == 'PROVIDER_REJECT':
                 ok = await self.db.update_provider_status(pid, 'rejected')
+                self._invalidate_providers_cache(prov.get('service_type'))
                 if ok:
                     try:
                         await self._log_and_send_response(prov.get('whatsapp_number'), "Your provider registration was rejected.", "provider_rejected")
@@ -2341,9 +2805,11 @@ class MessageHandler:
                 return ok, f"Provider rejected: {prov.get('name')}"
             if t == 'PROVIDER_SUSPEND':
                 ok = await self.db.update_provider_status(pid, 'suspended')
+                self._invalidate_providers_cache(prov.get('service_type'))
                 return ok, f"Provider suspended: {prov.get('name')}"
             if t == 'PROVIDER_BLACKLIST':
                 ok = await self.db.update_provider_status(pid, 'blacklisted')
+                self._invalidate_providers_cache(prov.get('service_type'))
                 return ok, f"Provider blacklisted: {prov.get('name')}"
 
         # Account management (users & providers): suspend/reactivate/delete/view
@@ -2370,7 +2836,7 @@ class MessageHandler:
             async def _find_user(token: str) -> Optional[Dict[str, Any]]:
                 if not token:
                     return None
-                if re.fullmatch(r"[0-9a-f]{24}", token):
+                if OBJECT_ID_RE.fullmatch(token):
                     return await self.db.get_user_by_id(token)
                 pn = self._normalize_msisdn(token)
                 return await self.db.get_user(pn) if pn else None
@@ -2407,6 +2873,7 @@ class MessageHandler:
                         'updated_at': now,
                     }
                     ok = await self.db.update_provider_fields(pid, updates)
+                    self._invalidate_providers_cache(prov.get('service_type'))
                     return ok, ("Suspended." if ok else "No change.")
                 if t == 'REACTIVATE_ACCOUNT':
                     updates = {
@@ -2419,11 +2886,13 @@ class MessageHandler:
                         'updated_at': now,
                     }
                     ok = await self.db.update_provider_fields(pid, updates)
+                    self._invalidate_providers_cache(prov.get('service_type'))
                     return ok, ("Reactivated." if ok else "No change.")
                 if t == 'DELETE_ACCOUNT':
                     mode = (entities.get('mode') or 'soft').lower()
                     if mode == 'hard':
                         ok = await self.db.delete_provider_by_id(pid)
+                        self._invalidate_providers_cache(prov.get('service_type'))
                         return ok, ("Deleted (hard)." if ok else "No change.")
                     updates = {
                         'status': 'deleted',
@@ -2432,6 +2901,7 @@ class MessageHandler:
                         'updated_at': now,
                     }
                     ok = await self.db.update_provider_fields(pid, updates)
+                    self._invalidate_providers_cache(prov.get('service_type'))
                     return ok, ("Deleted (soft)." if ok else "No change.")
 
             if target == 'user':
@@ -2478,6 +2948,7 @@ class MessageHandler:
                         if not u_phone:
                             return False, "Cannot hard-delete: missing phone."
                         ok = await self.db.delete_user_and_data(u_phone)
+                        self._forget_user(u_phone)
                         return ok, ("Deleted (hard)." if ok else "No change.")
                     updates = {
                         'status': 'deleted',
@@ -2534,7 +3005,7 @@ class MessageHandler:
             if not bid or not token:
                 return False, "Missing booking_id or provider."
             prov = None
-            if re.fullmatch(r"[0-9a-f]{24}", token):
+            if OBJECT_ID_RE.fullmatch(token):
                 prov = await self.db.get_provider_by_id(token)
             else:
                 pn = self._normalize_msisdn(token)
@@ -2564,6 +3035,7 @@ class MessageHandler:
                 return False, "Provide a WhatsApp number."
             await self.db.delete_session(msisdn)
             await self.db.delete_conversation_history(msisdn)
+            self._forget_user(msisdn)
             return True, "Conversation reset."
         # Stats
         if t == 'STATS':
@@ -2597,24 +3069,32 @@ class MessageHandler:
             return True, "User blocked."
         return False, "Unknown action."
 
-    async def _list_providers_for_selection(self, user_number: str, service_type: str, raw_location: str, session: Dict, user: Dict) -> None:
-        """Helper to fetch and display a list of providers for selection."""
+    async def _list_providers_for_selection(self, user_number: str, service_type: str, raw_location: str, session: Dict, user: Dict, preloaded: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Helper to fetch and display a list of providers for selection.
+
+        ``preloaded`` is an already-fetched, location-agnostic provider list for
+        ``service_type``; when given it replaces the unfiltered DB lookup.
+        """
         try:
             # Normalize to our known service areas
-            from app.utils.location_extractor import get_location_extractor
-            location_extractor = get_location_extractor()
+            location_extractor = self._location_extractor
             norm_location = location_extractor.normalize_user_location(raw_location) if raw_location else None
 
             providers: List[Dict[str, Any]] = []
             used_broad_fallback = False
+            # Unfiltered list for the service; fetched at most once per call
+            all_for_service = preloaded
             if service_type:
                 if norm_location:
-                    providers = await self.db.get_providers_by_service(service_type, norm_location)
+                    providers = await self._get_providers_cached(service_type, norm_location)
                 else:
-                    providers = await self.db.get_providers_by_service(service_type)
+                    if all_for_service is None:
+                        all_for_service = await self._get_providers_cached(service_type)
+                    providers = all_for_service
 
             if not providers and service_type:
-                all_for_service = await self.db.get_providers_by_service(service_type)
+                if all_for_service is None:
+                    all_for_service = await self._get_providers_cached(service_type)
                 if norm_location:
                     providers = location_extractor.filter_providers_by_location(all_for_service, norm_location)
                 else:
@@ -2622,13 +3102,10 @@ class MessageHandler:
 
             # Final fallback: if still none and we had a location constraint, ignore location entirely
             if not providers and service_type:
-                try:
-                    # Only mark as broad when we had a location that yielded no results
-                    if norm_location or (raw_location and raw_location.strip()):
-                        providers = await self.db.get_providers_by_service(service_type)
-                        used_broad_fallback = bool(providers)
-                except Exception:
-                    pass
+                # Only mark as broad when we had a location that yielded no results
+                if norm_location or (raw_location and raw_location.strip()):
+                    providers = all_for_service or []
+                    used_broad_fallback = bool(providers)
 
             if not providers:
                 header_loc = (norm_location or (user or {}).get("location") or "your area").strip()
@@ -2639,18 +3116,14 @@ class MessageHandler:
                     "2) Change the location\n"
                     "3) Be notified when one becomes available"
                 )
-                buttons = [
-                    {"id": "opt_change_time", "title": "Change time"},
-                    {"id": "opt_change_location", "title": "Change location"},
-                    {"id": "opt_notify_me", "title": "Notify me"},
-                ]
-                await self._log_and_send_interactive(user_number, "No providers available", body, buttons, None)
-                session.setdefault("data", {})
-                session["data"]["_no_providers_ctx"] = {
-                    "service_type": service_type,
-                    "location": norm_location or raw_location or (user or {}).get("location") or "",
-                }
-                session["state"] = ConversationState.NO_PROVIDERS_OPTIONS
+                await self._present_no_providers(
+                    user_number, body, session,
+                    {
+                        "service_type": service_type,
+                        "location": norm_location or raw_location or (user or {}).get("location") or "",
+                    },
+                    ("opt_change_time", "opt_change_location", "opt_notify_me"),
+                )
                 return
 
             # Rank providers (non-destructive scoring; safe if fields missing)
@@ -2714,11 +3187,11 @@ class MessageHandler:
             except Exception:
                 pass
 
-            session.setdefault("data", {})
-            session["data"]["service_type"] = service_type
+            sd = session.setdefault("data", {})
+            sd["service_type"] = service_type
             # Safety rule: avoid showing the same top provider repeatedly to the same user
             try:
-                last_pid = (session.get('data') or {}).get('_last_provider_id')
+                last_pid = sd.get('_last_provider_id')
                 # Persisted last recommendation from user profile (with expiry)
                 if not last_pid:
                     rp = (user or {}).get('last_rec_provider') or {}
@@ -2747,34 +3220,23 @@ class MessageHandler:
             except Exception:
                 pass
 
-            session["data"]["providers"] = providers
+            sd["providers"] = providers
+            # Lowercased once here; name matching runs on every free-form reply
+            sd["_providers_lc"] = [(p.get('name') or '').lower() for p in providers]
             if norm_location:
-                session["data"]["location"] = norm_location
-
-            buttons: List[Dict[str, Any]] = []
-            for p in providers[:3]:
-                buttons.append({
-                    "id": f"provider_{p.get('whatsapp_number') or p.get('_id')}",
-                    "title": f"{p.get('name') or 'Provider'}",
-                })
+                sd["location"] = norm_location
 
             header_loc = norm_location or (user or {}).get("location") or "your area"
             if used_broad_fallback:
                 header_loc = "all areas"
-            await self._log_and_send_interactive(
-                user_number,
-                f"Available {service_type}s in {header_loc}",
-                self._build_friendly_provider_body(service_type or 'provider', header_loc, len(providers), session),
-                buttons,
-                self._friendly_footer(),
-            )
+            await self._present_providers(user_number, service_type, header_loc, providers, session)
 
             # Remember last shown top provider for spam prevention heuristic
             try:
                 top = providers[0] if providers else None
                 if top:
                     top_key = self._provider_unique_id(top)
-                    session.setdefault('data', {})['_last_provider_id'] = top_key
+                    sd['_last_provider_id'] = top_key
                     # Persist to user profile with a 30-minute TTL equivalent
                     try:
                         if top_key:
@@ -2788,12 +3250,36 @@ class MessageHandler:
                         pass
             except Exception:
                 pass
-
-            session["state"] = ConversationState.PROVIDER_SELECTION
         except Exception as e:
             logger.error(f"Error while listing providers: {e}")
             await self._log_and_send_response(user_number, "Sorry, I couldn't find providers right now. Please try again.", "provider_list_error")
 
+    async def _present_providers(self, user_number: str, service_type: str, header_loc: str, providers: List[Dict[str, Any]], session: Dict) -> None:
+        """Send the top providers as reply buttons and move to PROVIDER_SELECTION."""
+        buttons: List[Dict[str, Any]] = [
+            {
+                "id": f"provider_{p.get('whatsapp_number') or p.get('_id')}",
+                "title": f"{p.get('name') or 'Provider'}",
+            }
+            for p in islice(providers, 3)
+        ]
+        await self._log_and_send_interactive(
+            user_number,
+            f"Available {service_type}s in {header_loc}",
+            self._build_friendly_provider_body(service_type or 'provider', header_loc, len(providers), session),
+            buttons,
+            self._friendly_footer(),
+        )
+        session["state"] = ConversationState.PROVIDER_SELECTION
+
+    async def _present_no_providers(self, user_number: str, body: str, session: Dict, ctx: Dict[str, Any], button_ids: tuple) -> None:
+        """Offer change time / change location / notify me when nothing matched."""
+        titles = ("Change time", "Change location", "Notify me")
+        buttons = [{"id": bid, "title": title} for bid, title in zip(button_ids, titles)]
+        await self._log_and_send_interactive(user_number, "No providers available", body, buttons, None)
+        session.setdefault("data", {})["_no_providers_ctx"] = ctx
+        session["state"] = ConversationState.NO_PROVIDERS_OPTIONS
+
     async def handle_no_providers_options(self, user_number: str, message_text: str, session: Dict, user: Dict) -> None:
         text = (message_text or '').strip().lower()
         choice = None
@@ -2807,7 +3293,7 @@ class MessageHandler:
         if choice == 'time':
             await self._log_and_send_response(
                 user_number,
-                self._short("When would you like the service? (e.g., 'tomorrow 10am')", "When? (e.g., tomorrow 10am)"),
+                _FALLBACK_Q['datetime'],
                 "no_providers_change_time"
             )
             session['state'] = ConversationState.BOOKING_TIME
@@ -2815,7 +3301,7 @@ class MessageHandler:
         if choice == 'location':
             await self._log_and_send_response(
                 user_number,
-                self._short("Which area should I search in? (e.g., Harare, Bulawayo)", "Your area?"),
+                _FALLBACK_Q['location'],
                 "no_providers_change_location"
             )
             session['state'] = ConversationState.BOOKING_LOCATION
@@ -2885,14 +3371,17 @@ class MessageHandler:
         prompt_version = None
         try:
             actor = self._normalize_msisdn(user_number)
-            is_admin = actor in set(self._admin_numbers())
+            is_admin = actor in ADMIN_NUMBERS
         except Exception:
             is_admin = False
-        # Fetch provider status once
-        try:
-            prov = await self.db.get_provider_by_whatsapp(user_number)
-        except Exception:
-            prov = None
+        # Provider status and service availability are independent lookups;
+        # issue them together rather than back to back.
+        precomputed_service_type = self.extract_service_type(message_text)
+        lookups = [self.db.get_provider_by_whatsapp(user_number)]
+        if precomputed_service_type:
+            lookups.append(self._get_providers_cached(precomputed_service_type))
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+        prov = None if isinstance(results[0], Exception) else results[0]
         mode_override = str((session.get('mode_override') or '')).lower()
         if mode_override == 'admin' and is_admin:
             sp_override = getattr(settings, 'HUSTLR_ADMIN_PROMPT_V1', None)
@@ -2915,18 +3404,23 @@ class MessageHandler:
                 prompt_version = 'hustlr_client_prompt_v1'
 
         # --- Pre-computation: Check service availability before calling AI ---
-        precomputed_service_type = self.extract_service_type(message_text)
         service_available = None
         if precomputed_service_type:
             # Check if we have any providers for this service
-            providers = await self.db.get_providers_by_service(precomputed_service_type)
+            providers = results[1]
+            if isinstance(providers, Exception):
+                raise providers
             service_available = bool(providers)
 
+        # Bind session data once; setdefault keeps session["data"] the same
+        # object, so writes through sdata land in the session.
+        sdata = session.setdefault("data", {})
+
         user_context: Dict[str, Any] = {
             "user_name": (user or {}).get("name"),
             "user_location": (user or {}).get("location"),
             "session_state": str(session.get("state")),
-            "known_fields": (session.get("data") or {}),
+            "known_fields": sdata,
             "system_prompt_override": sp_override,
             "prompt_version": prompt_version,
         }
@@ -2967,7 +3461,7 @@ class MessageHandler:
 
         payload: Any = None
         try:
-            payload = json.loads(text)
+            payload = _loads_json(text)
         except Exception:
             # Treat whole response as plain text if JSON parsing fails
             await self._log_and_send_response(
@@ -2992,14 +3486,16 @@ class MessageHandler:
 
             # Shallow merge any data into session for future turns
             if isinstance(data, dict):
-                session.setdefault("data", {})
-                session["data"].update(data)
+                sdata.update(data)
+                # A new booking_time supersedes any datetime parsed for the old one
+                if 'booking_time' in data and not isinstance(data.get('booking_time_dt'), datetime):
+                    sdata.pop('booking_time_dt', None)
 
             # Special handling: when Claude says CONFIRM selected_provider, actually
             # list real providers for the chosen service/location so the user can pick.
             if status == "CONFIRM" and field == "selected_provider":
-                service_type = (data.get("service_type") or (session.get("data") or {}).get("service_type") or "").strip().lower()
-                raw_location = (data.get("location") or (session.get("data") or {}).get("location") or (user or {}).get("location") or "").strip()
+                service_type = (data.get("service_type") or sdata.get("service_type") or "").strip().lower()
+                raw_location = (data.get("location") or sdata.get("location") or (user or {}).get("location") or "").strip()
 
                 # Check for existing active bookings for a similar service type
                 active_bookings = await self.db.get_active_bookings_for_user(user_number)
@@ -3028,11 +3524,11 @@ class MessageHandler:
                             existing_service_tokens.update(synonyms_map.get(token, []))
                         
                         if new_service_tokens.intersection(existing_service_tokens):
-                            session["data"]["_pending_booking_request"] = {
+                            sdata["_pending_booking_request"] = {
                                 "service_type": service_type,
                                 "location": raw_location,
                             }
-                            session["data"]["_conflicting_booking_id"] = booking.get("booking_id")
+                            sdata["_conflicting_booking_id"] = booking.get("booking_id")
                             session["state"] = ConversationState.CANCEL_EXISTING_BOOKING_CONFIRM
                             await self._log_and_send_response(
                                 user_number,
@@ -3041,7 +3537,12 @@ class MessageHandler:
                             )
                             return
 
-                await self._list_providers_for_selection(user_number, service_type, raw_location, session, user)
+                # Reuse the availability lookup made before the AI call when it
+                # was for the same service, instead of querying again.
+                preloaded = None
+                if precomputed_service_type and precomputed_service_type == service_type and isinstance(providers, list):
+                    preloaded = providers
+                await self._list_providers_for_selection(user_number, service_type, raw_location, session, user, preloaded=preloaded)
 
             # Execute booking-level actions that Claude has already explained
             # to the user via assistantMessage. Backend only performs the
@@ -3051,11 +3552,11 @@ class MessageHandler:
                     # Claude may send a single booking_id or a list of booking_ids
                     bids_any = []
                     # Single id
-                    single_bid = (data or {}).get("booking_id") or (session.get("data") or {}).get("_cancel_booking_id")
+                    single_bid = data.get("booking_id") or sdata.get("_cancel_booking_id")
                     if single_bid:
                         bids_any.append(single_bid)
                     # List of ids
-                    many_bids = (data or {}).get("booking_ids") or []
+                    many_bids = data.get("booking_ids") or []
                     if isinstance(many_bids, list):
                         bids_any.extend([b for b in many_bids if b])
 
@@ -3073,26 +3574,24 @@ class MessageHandler:
                             pass
                 finally:
                     # Clear any local helper fields but keep general session data
-                    if session.get("data"):
-                        session["data"].pop("_cancel_booking_id", None)
-                        session["data"].pop("_bookings_list", None)
+                    if sdata:
+                        sdata.pop("_cancel_booking_id", None)
+                        sdata.pop("_bookings_list", None)
                     session["state"] = ConversationState.SERVICE_SEARCH
                 return
 
             if status == "COMPLETE" and field == "reschedule_booking":
                 try:
-                    bid = (data or {}).get("booking_id") or (session.get("data") or {}).get("_reschedule_booking_id")
-                    new_time = (data or {}).get("new_time") or (data or {}).get("date_time") or (session.get("data") or {}).get("_reschedule_new_time")
+                    bid = data.get("booking_id") or sdata.get("_reschedule_booking_id")
+                    new_time = data.get("new_time") or data.get("date_time") or sdata.get("_reschedule_new_time")
                     if bid and new_time:
                         try:
                             await self.db.update_booking_time(bid, new_time, set_status="pending")
                         except Exception:
                             pass
                 finally:
-                    if session.get("data"):
-                        session["data"].pop("_reschedule_booking_id", None)
-                        session["data"].pop("_reschedule_new_time", None)
-                        session["data"].pop("_bookings_list", None)
+                    for k in _RESCHED_KEYS:
+                        sdata.pop(k, None)
                     session["state"] = ConversationState.SERVICE_SEARCH
                 return
 
@@ -3101,15 +3600,15 @@ class MessageHandler:
                 try:
                     # Compose a date_time string
                     date_time = (
-                        (data or {}).get("date_time")
-                        or (data or {}).get("scheduled_time")
-                        or (f"{(data or {}).get('date')} {(data or {}).get('time')}" if ((data or {}).get('date') and (data or {}).get('time')) else None)
+                        data.get("date_time")
+                        or data.get("scheduled_time")
+                        or (f"{data.get('date')} {data.get('time')}" if (data.get('date') and data.get('time')) else None)
                     )
                     # Resolve provider WhatsApp number if an id is present
-                    prov_id = (data or {}).get("provider_id") or (data or {}).get("provider")
+                    prov_id = data.get("provider_id") or data.get("provider")
                     provider = None
                     provider_phone = None
-                    service_cur = ((data or {}).get("service_type") or "").strip().lower()
+                    service_cur = (data.get("service_type") or "").strip().lower()
                     # Prefer explicit provider id from current payload only
                     if prov_id:
                         provider = await self.db.get_provider(prov_id)
@@ -3117,10 +3616,13 @@ class MessageHandler:
                             provider_phone = provider.get("whatsapp_number")
                     # Otherwise, resolve provider based on current booking data (service + location)
                     if not provider:
-                        raw_loc = (data or {}).get('location') or (user or {}).get('location') or ''
+                        raw_loc = data.get('location') or (user or {}).get('location') or ''
                         # Try to find providers for this service
                         try:
-                            candidates = await self.db.get_providers_by_service(service_cur) if service_cur else []
+                            if service_cur and service_cur == precomputed_service_type and isinstance(providers, list):
+                                candidates = providers
+                            else:
+                                candidates = await self._get_providers_cached(service_cur) if service_cur else []
                         except Exception:
                             candidates = []
                         # Filter by location if available
@@ -3145,22 +3647,22 @@ class MessageHandler:
                         logger.error(f"{ae}")
 
                     booking_doc = {
-                        "service_type": service_cur or (data or {}).get("service_type"),
+                        "service_type": service_cur or data.get("service_type"),
                         "customer_whatsapp_number": user_number,
                         "provider_whatsapp_number": provider_phone,
                         "booking_time": date_time,
                         "status": "pending",
-                        "problem_description": (data or {}).get("problem_description"),
+                        "problem_description": data.get("problem_description"),
                     }
 
                     # Add optional fields
-                    cust_phone = (data or {}).get('customer_phone')
+                    cust_phone = data.get('customer_phone')
                     if cust_phone:
                         booking_doc['customer_phone'] = cust_phone
-                    cust_name = (data or {}).get('customer_name')
+                    cust_name = data.get('customer_name')
                     if cust_name:
                         booking_doc['customer_name'] = cust_name
-                    loc = (data or {}).get('location') or (user or {}).get('location')
+                    loc = data.get('location') or (user or {}).get('location')
                     if loc:
                         booking_doc['location'] = loc
 
@@ -3185,213 +3687,43 @@ class MessageHandler:
                     logger.error(f"Failed to create booking from AI response: {e}")
 
                 # Clear session data after booking is complete
-                if session.get("data"):
+                if sdata:
                     keys_to_clear = [
                         '_pending_booking', 'selected_provider_index', '_bookings_list',
                         '_cancel_booking_id', '_reschedule_booking_id', '_reschedule_new_time',
-                        'service_type', 'providers', 'selected_provider', 'selected_providers',
+                        'service_type', 'providers', '_providers_lc', 'selected_provider', 'selected_providers',
                         'all_providers', 'current_provider', 'active_booking', 'booking_context',
-                        'booking_time', 'location', 'issue', 'problem_description', 'date', 'time'
+                        'booking_time', 'booking_time_dt', 'location', 'issue', 'problem_description', 'date', 'time'
                     ]
                     for k in keys_to_clear:
-                        session["data"].pop(k, None)
+                        sdata.pop(k, None)
                 session["state"] = ConversationState.SERVICE_SEARCH
                 return
 
     def extract_service_type(self, message_text: str, return_map: bool = False) -> Optional[str]:
         """Extract service type from message text using keyword matching."""
-        message_text = (message_text or '').lower()
-        # Expanded service map
-        services = {
-            'plumber': 'plumber',
-            'plumbing': 'plumber',
-            'electrician': 'electrician',
-            'electrical': 'electrician',
-            'electricity': 'electrician',
-            'carpenter': 'carpenter',
-            'carpentry': 'carpenter',
-            'wood': 'carpenter',
-            'painter': 'painter',
-            'painting': 'painter',
-            'cleaner': 'cleaner',
-            'cleaning': 'cleaner',
-            'mechanic': 'mechanic',
-            'repair': 'mechanic',
-            'gardener': 'gardener',
-            'gardening': 'gardener',
-            'landscaping': 'gardener',
-            'builder': 'builder',
-            'building': 'builder',
-            'construction': 'builder',
-            'welder': 'welder',
-            'welding': 'welder',
-            'driver': 'driver',
-            'driving': 'driver',
-            'transport': 'driver',
-            'tiler': 'tiler',
-            'tiling': 'tiler',
-            'technician': 'technician',
-            'gadget': 'technician',
-            'appliance': 'technician',
-            'dstv': 'technician',
-            'cctv': 'technician',
-            'solar': 'technician',
-            'inverter': 'technician',
-            'fridge': 'technician',
-            'refridgeration': 'technician',
-            'aircon': 'technician',
-            'air con': 'technician',
-            'air-con': 'technician',
-            'airconditioner': 'technician',
-            'air conditioner': 'technician',
-            'air-conditioner': 'technician',
-            'laundry': 'laundry',
-            'washing': 'laundry',
-            'ironing': 'laundry',
-            'gas': 'gas',
-            'refill': 'gas',
-            'tutor': 'tutor',
-            'tution': 'tutor',
-            'lessons': 'tutor',
-            'extra lessons': 'tutor',
-            'catering': 'catering',
-            'caterer': 'catering',
-            'food': 'catering',
-            'events': 'catering',
-            'chef': 'catering',
-            'cook': 'catering',
-            'photography': 'photography',
-            'photographer': 'photography',
-            'photos': 'photography',
-            'videos': 'photography',
-            'video': 'photography',
-            'videographer': 'photography',
-            'designer': 'designer',
-            'graphic': 'designer',
-            'design': 'designer',
-            # Software/engineering keywords
-            'software developer': 'developer',
-            'software': 'developer',
-            'developer': 'developer',
-            'programmer': 'developer',
-            'engineer': 'developer',
-            'web developer': 'developer',
-            'frontend': 'developer',
-            'backend': 'developer',
-            'mobile': 'developer',
-            'android': 'developer',
-            'ios': 'developer',
-            'flutter': 'developer',
-            'react': 'developer',
-            'tailor': 'tailor',
-            'dressmaker': 'tailor',
-            'sewing': 'tailor',
-            'alterations': 'tailor',
-            'beautician': 'beautician',
-            'beauty': 'beautician',
-            'nails': 'beautician',
-            'manicure': 'beautician',
-            'pedicure': 'beautician',
-            'makeup': 'beautician',
-            'artist': 'beautician',
-            'hair': 'beautician',
-            'stylist': 'beautician',
-            'barber': 'beautician',
-            'salon': 'beautician',
-            'massage': 'massage',
-            'therapist': 'massage',
-            'therapy': 'massage',
-            'fitness': 'fitness',
-            'trainer': 'fitness',
-            'gym': 'fitness',
-            'coach': 'fitness',
-            'health': 'fitness',
-            'nutritionist': 'fitness',
-            'dietician': 'fitness',
-            'accountant': 'accountant',
-            'accounting': 'accountant',
-            'bookkeeper': 'accountant',
-            'tax': 'accountant',
-            'consultant': 'consultant',
-            'business': 'consultant',
-            'strategy': 'consultant',
-            'marketing': 'consultant',
-            'legal': 'legal',
-            'lawyer': 'legal',
-            'attorney': 'legal',
-            'paralegal': 'legal',
-            'security': 'security',
-            'guard': 'security',
-            'bouncer': 'security',
-            'alarm': 'security',
-            'fumigation': 'fumigation',
-            'pest': 'fumigation',
-            'control': 'fumigation',
-            'fumigator': 'fumigation',
-            'interior': 'interior',
-            'decorator': 'interior',
-            'design': 'interior',
-            'furniture': 'interior',
-            'upholstery': 'interior',
-            'courier': 'courier',
-            'delivery': 'courier',
-            'errands': 'courier',
-            'logistics': 'courier',
-            'car': 'car',
-            'rental': 'car',
-            'hire': 'car',
-            'vehicle': 'car',
-            'event': 'event',
-            'planner': 'event',
-            'planning': 'event',
-            'mc': 'event',
-            'dj': 'event',
-            'sound': 'event',
-            'hire': 'event',
-            'real': 'real',
-            'estate': 'real',
-            'agent': 'real',
-            'property': 'real',
-            'realtor': 'real',
-            ' borehole': 'borehole',
-            'drilling': 'borehole',
-            'water': 'borehole',
-            'survey': 'borehole',
-            'casing': 'borehole',
-            'installation': 'borehole',
-            'pump': 'borehole',
-            'tank': 'borehole',
-            'stand': 'borehole',
-            'recruiter': 'recruiter',
-            'recruitment': 'recruiter',
-            'hiring': 'recruiter',
-            'staffing': 'recruiter',
-        }
-
         if return_map:
-            return services
-
-        for keyword, service in services.items():
-            if keyword in message_text:
-                return service
-        # Fuzzy fallback using rapidfuzz aliases
-        try:
-            fuzzy = find_best_service_match(message_text)
-            if fuzzy:
-                return fuzzy
-        except Exception:
-            pass
-
-        return None
+            return SERVICE_KEYWORDS
+        return _service_type_from_text((message_text or '').lower())
 
     def _parse_relative_time(self, time_str: str) -> Optional[datetime]:
         """Parse a relative time string into a datetime object."""
-        now = datetime.now()
         t_raw = (time_str or '').strip().lower()
+        if not t_raw:
+            return None
+
+        # Fast path: canonical ISO input needs no fuzzy parsing (and no clock read)
+        if ISO_DATETIME_RE.fullmatch(t_raw):
+            try:
+                return datetime.fromisoformat(t_raw.replace('t', ' '))
+            except ValueError:
+                pass
+
+        now = datetime.now()
         t = ' ' + t_raw + ' '
 
         # "in 5 minutes", "in 2 hours", "in 3 days", "in 1 week"
-        m = re.search(r"\s(in|for)\s+(\d+)\s+(minute|hour|day|week)s?(\s|$)", t)
+        m = RELATIVE_OFFSET_RE.search(t)
         if m:
             n = int(m.group(2))
             unit = m.group(3)
@@ -3408,87 +3740,107 @@ class MessageHandler:
 
         # Keywords today/tomorrow/tonight with optional time after
         def parse_with_base(remove_word: str, base: datetime, default_hour: int = 9) -> Optional[datetime]:
-            remainder = re.sub(fr"(?i)\b{remove_word}\b", '', t_raw).strip()
+            remainder = DAY_WORD_RES[remove_word].sub('', t_raw).strip()
+            base_dt = base.replace(hour=default_hour, minute=0, second=0, microsecond=0)
             if remainder:
-                try:
-                    return du_parse(remainder, fuzzy=True, default=base.replace(hour=default_hour, minute=0, second=0, microsecond=0))
-                except Exception:
-                    return base.replace(hour=default_hour, minute=0, second=0, microsecond=0)
-            return base.replace(hour=default_hour, minute=0, second=0, microsecond=0)
-
-        if 'tomorrow' in t:
-            return parse_with_base('tomorrow', now + timedelta(days=1), 9)
-        if 'today' in t:
-            return parse_with_base('today', now, 9)
-        if 'tonight' in t:
-            return parse_with_base('tonight', now, 18)
-        if 'now' in t:
-            return now
-
-        # "next monday 3pm"
-        weekdays = ['monday','tuesday','wednesday','thursday','friday','saturday','sunday']
-        for idx, name in enumerate(weekdays):
-            if f'next {name}' in t:
-                days_ahead = (idx - now.weekday() + 7) % 7
-                days_ahead = days_ahead if days_ahead != 0 else 7
-                base = now + timedelta(days=days_ahead)
-                return parse_with_base(f'next {name}', base, 9)
-            if f'this {name}' in t:
-                days_ahead = (idx - now.weekday() + 7) % 7
-                base = now + timedelta(days=days_ahead)
-                return parse_with_base(f'this {name}', base, 9)
+                return _du_parse_cached(remainder, base_dt) or base_dt
+            return base_dt
+
+        # One scan decides whether any day word is present before the keyword ladder
+        if DAY_WORD_HINT_RE.search(t):
+            if 'tomorrow' in t:
+                return parse_with_base('tomorrow', now + timedelta(days=1), 9)
+            if 'today' in t:
+                return parse_with_base('today', now, 9)
+            if 'tonight' in t:
+                return parse_with_base('tonight', now, 18)
+            if 'now' in t:
+                return now
+
+            # "next monday 3pm"
+            wm = NEXT_THIS_WEEKDAY_RE.search(t)
+            if wm:
+                days_ahead = (WEEKDAY_IDX[wm.group(2)] - now.weekday() + 7) % 7
+                if wm.group(1) == 'next' and days_ahead == 0:
+                    days_ahead = 7
+                return parse_with_base(wm.group(0), now + timedelta(days=days_ahead), 9)
 
         # Generic parse attempts (covers: "Dec 31 15:00", "2025-12-31 15:00", "31/12/2025 15:00", "3pm")
-        def try_du(s: str, **kwargs) -> Optional[datetime]:
-            try:
-                return du_parse(s, fuzzy=True, default=now, **kwargs)
-            except Exception:
-                return None
-
-        dt = try_du(t_raw)
+        now_min = now.replace(second=0, microsecond=0)
+        dt = _du_parse_cached(t_raw, now_min)
         if not dt:
-            dt = try_du(t_raw, dayfirst=True)
+            dt = _du_parse_cached(t_raw, now_min, True)
         if not dt:
             return None
 
         # If only time was provided and it's already passed today, roll to next day
-        has_date_hint = bool(re.search(r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b", t)) or bool(re.search(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b", t, re.I)) or bool(re.search(r"\b\d{1,2}/\d{1,2}\b", t))
+        has_date_hint = DATE_HINT_RE.search(t) is not None
         if not has_date_hint and dt <= now:
             dt = dt + timedelta(days=1)
 
         return dt
 
     def _canonicalize_booking_time(self, time_str: str) -> Optional[datetime]:
-        """Parse a human-readable time string into a canonical datetime object."""
-        return self._parse_relative_time(time_str)
+        """Parse a human-readable time string into a canonical datetime object.
+
+        Returns None for text that doesn't parse, including offsets out of
+        datetime's range and tz-aware results that can't be compared with now.
+        """
+        try:
+            return self._parse_relative_time(time_str)
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+    async def _canonicalize_booking_time_async(self, time_str: str) -> Optional[datetime]:
+        """_canonicalize_booking_time for async handlers, kept off the event loop.
+
+        Canonical ISO input is cheap and parsed in-loop; anything else may fall
+        through to fuzzy dateutil parsing, which is CPU-bound, so it runs in a
+        worker thread and the result is memoized for the current minute.
+        """
+        norm = " ".join((time_str or '').lower().split())
+        if ISO_DATETIME_RE.fullmatch(norm):
+            return self._canonicalize_booking_time(time_str)
+        # Repeat phrasings within the same minute are answered in-loop, skipping the thread hop
+        key = (norm, int(time.time() // 60))
+        if key in self._dt_cache:
+            self._dt_cache.move_to_end(key)
+            return self._dt_cache[key]
+        dt = await asyncio.to_thread(self._canonicalize_booking_time, time_str)
+        self._dt_cache[key] = dt
+        while len(self._dt_cache) > DT_CACHE_MAX:
+            self._dt_cache.popitem(last=False)
+        return dt
 
     def _format_booking_time_for_display(self, dt_text: str) -> str:
         s = (dt_text or '').strip()
         if not s:
             return 'Time not set'
-        # Try parse ISO
-        try:
-            dt = datetime.fromisoformat(s.replace('Z', '+00:00'))
-            return dt.strftime('%Y-%m-%d %H:%M')
-        except Exception:
-            pass
+        # Stored booking times are usually already in display form
+        if DISPLAY_TIME_RE.fullmatch(s):
+            return s
+        # Only attempt ISO parsing on ISO-shaped input, avoiding a raise/catch otherwise
+        if ISO_PREFIX_RE.match(s):
+            try:
+                dt = datetime.fromisoformat(s.replace('Z', '+00:00'))
+                return _fmt_booking_time(dt)
+            except ValueError:
+                pass
         # Try canonicalize from natural text
-        try:
-            dt2 = self._canonicalize_booking_time(s)
-            if dt2:
-                return dt2.strftime('%Y-%m-%d %H:%M')
-        except Exception:
-            pass
+        dt2 = self._canonicalize_booking_time(s)
+        if dt2:
+            return _fmt_booking_time(dt2)
         return s
 
-    def _generate_booking_id(self) -> str:
+    def _generate_booking_id(self, now: Optional[datetime] = None) -> str:
         """Generate a compact, unique-ish booking id without extra imports."""
+        now = now or datetime.utcnow()
         try:
             # Example: B20251218T112233123456 (UTC timestamp-based)
-            return 'B' + datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
+            return 'B' + now.strftime('%Y%m%d%H%M%S%f')
         except Exception:
             # Last resort
-            return f"B{int(datetime.utcnow().timestamp()*1000)}"
+            return f"B{int(now.timestamp()*1000)}"
 
     async def _ai_action_create_booking(self, user_number: str, payload: Dict, session: Dict, user: Dict) -> None:
         """Handle booking creation from a structured AI payload."""
@@ -3501,19 +3853,23 @@ class MessageHandler:
             await self._log_and_send_response(user_number, "I'm missing some details to make the booking. Could you please clarify the service, provider, and time?", "booking_payload_incomplete")
             return
 
-        providers = (session.get('data') or {}).get('providers') or []
+        sd = session.get('data') or {}
+        providers = sd.get('providers') or []
         if not (isinstance(prov_idx, int) and 1 <= prov_idx <= len(providers)):
             await self._log_and_send_response(user_number, "That's not a valid provider selection. Please choose a number from the list.", "booking_provider_index_invalid")
             return
 
         provider = providers[prov_idx - 1]
-        booking_time_dt = self._canonicalize_booking_time(time_text)
+        # Reuse a datetime parsed earlier in the flow instead of re-parsing the text
+        booking_time_dt = payload.get('time_dt')
+        if not isinstance(booking_time_dt, datetime):
+            booking_time_dt = await self._canonicalize_booking_time_async(time_text)
         if not booking_time_dt:
             await self._log_and_send_response(user_number, "I couldn't understand that time. Please try something like 'tomorrow at 10am' or 'Dec 20 14:30'.", "booking_time_invalid")
             return
 
-        booking_time = booking_time_dt.strftime('%Y-%m-%d %H:%M')
-        location = (session.get('data') or {}).get('location') or (user or {}).get('location') or ''
+        booking_time = _fmt_booking_time(booking_time_dt)
+        location = sd.get('location') or (user or {}).get('location') or ''
 
         # Provider lock to avoid double-assigning concurrently
         locked = True
@@ -3555,15 +3911,11 @@ class MessageHandler:
                     "2) Change the location\n"
                     "3) Be notified when one becomes available"
                 )
-                buttons = [
-                    {"id": "opt_noprov_1", "title": "Change time"},
-                    {"id": "opt_noprov_2", "title": "Change location"},
-                    {"id": "opt_noprov_3", "title": "Notify me"},
-                ]
-                await self._log_and_send_interactive(user_number, "No providers available", body, buttons, None)
-                session.setdefault("data", {})
-                session["data"]["_no_providers_ctx"] = {"service_type": s_type, "location": location}
-                session['state'] = ConversationState.NO_PROVIDERS_OPTIONS
+                await self._present_no_providers(
+                    user_number, body, session,
+                    {"service_type": s_type, "location": location},
+                    ("opt_noprov_1", "opt_noprov_2", "opt_noprov_3"),
+                )
                 return
             else:
                 chosen_provider = alt
@@ -3574,8 +3926,9 @@ class MessageHandler:
         # Basic check, can be improved with synonyms
         assert request_service in provider_service or provider_service in request_service, f"Provider {chosen_provider.get('_id')} does not offer {request_service}"
 
+        now = datetime.utcnow()
         booking_doc = {
-            'booking_id': self._generate_booking_id(),
+            'booking_id': self._generate_booking_id(now),
             'customer_whatsapp_number': user_number,
             'user_whatsapp_number': user_number,
             'provider_whatsapp_number': chosen_provider.get('whatsapp_number'),
@@ -3584,12 +3937,11 @@ class MessageHandler:
             'date_time': booking_time,
             'location': location,
             'status': 'pending',
-            'created_at': datetime.utcnow().isoformat(),
-            'problem_description': issue or (session.get('data') or {}).get('issue') or ''
+            'created_at': now.isoformat(),
+            'problem_description': issue or sd.get('issue') or ''
         }
 
         await self.db.create_booking(booking_doc)
-        await self._notify_booking_other_party(user_number, booking_doc['booking_id'], 'new')
 
         msg = (
             f"Booking confirmed!\n"
@@ -3597,7 +3949,12 @@ class MessageHandler:
             f"Location: {location}\n"
             f"Date: {booking_time}"
         )
-        await self._log_and_send_response(user_number, msg, "booking_creation_confirmed")
+        # The booking we just inserted is already in hand: notify the provider
+        # from it and confirm to the customer in the same round-trip.
+        await asyncio.gather(
+            self._notify_booking_other_party(user_number, booking_doc['booking_id'], 'new', booking=booking_doc),
+            self._log_and_send_response(user_number, msg, "booking_creation_confirmed"),
+        )
 
         # Hard reset of session data after booking to prevent contamination
         session['state'] = ConversationState.SERVICE_SEARCH
@@ -3612,7 +3969,8 @@ class MessageHandler:
         'book Jayhind tomorrow 10am', or just a time after a prior selection.
         """
         try:
-            providers = (session.get('data') or {}).get('providers') or []
+            sd = session.setdefault('data', {})
+            providers = sd.get('providers') or []
             if not providers:
                 return False
             text = (message_text or '').strip().lower()
@@ -3620,18 +3978,20 @@ class MessageHandler:
                 return False
 
             # Determine provider index from text or previous selection
-            idx: Optional[int] = self._resolve_provider_index_from_text(providers, message_text)
+            idx: Optional[int] = self._resolve_provider_index_from_text(
+                providers, message_text, sd.get('_providers_lc')
+            )
 
             # Fallback to previously selected index if present
             if idx is None:
-                prev_idx = (session.get('data') or {}).get('selected_provider_index')
+                prev_idx = sd.get('selected_provider_index')
                 if isinstance(prev_idx, int) and 1 <= prev_idx <= len(providers):
                     idx = prev_idx
 
             # Try extract a time from the message
             time_dt = None
             try:
-                time_dt = self._canonicalize_booking_time(message_text)
+                time_dt = await self._canonicalize_booking_time_async(message_text)
             except Exception:
                 time_dt = None
 
@@ -3640,15 +4000,19 @@ class MessageHandler:
 
             # If we have a provider index but no time in this message
             if idx is not None and not time_dt:
-                sd = session.setdefault('data', {})
                 # If a booking_time is already collected earlier, use it directly
                 stored_time = (sd.get('booking_time') or '').strip()
                 if stored_time:
+                    # Only reuse the parsed datetime while it still matches the stored text
+                    stored_dt = sd.get('booking_time_dt')
+                    if not isinstance(stored_dt, datetime) or _fmt_booking_time(stored_dt) != stored_time:
+                        stored_dt = None
                     payload = {
                         'action': 'create_booking',
                         'service_type': (sd.get('service_type') or ''),
                         'provider_index': idx,
                         'time_text': stored_time,
+                        'time_dt': stored_dt,
                         'issue': (sd.get('issue') or '')
                     }
                     await self._ai_action_create_booking(user_number, payload, session, user)
@@ -3657,7 +4021,7 @@ class MessageHandler:
                 sd['selected_provider_index'] = idx
                 await self._log_and_send_response(
                     user_number,
-                    self._short("When would you like the service? (e.g., 'tomorrow 10am')", "When? (e.g., tomorrow 10am)"),
+                    _FALLBACK_Q['datetime'],
                     "ask_time_for_booking_quick"
                 )
                 session['state'] = ConversationState.BOOKING_TIME
@@ -3665,7 +4029,7 @@ class MessageHandler:
 
             # If we only have a time, use the previously selected provider index
             if time_dt and idx is None:
-                prev_idx = (session.get('data') or {}).get('selected_provider_index')
+                prev_idx = sd.get('selected_provider_index')
                 if isinstance(prev_idx, int) and 1 <= prev_idx <= len(providers):
                     idx = prev_idx
                 else:
@@ -3675,10 +4039,11 @@ class MessageHandler:
             if idx is not None:
                 payload = {
                     'action': 'create_booking',
-                    'service_type': (session.get('data', {}) or {}).get('service_type') or '',
+                    'service_type': sd.get('service_type') or '',
                     'provider_index': idx,
                     'time_text': message_text,
-                    'issue': (session.get('data', {}) or {}).get('issue') or ''
+                    'time_dt': time_dt,
+                    'issue': sd.get('issue') or ''
                 }
                 await self._ai_action_create_booking(user_number, payload, session, user)
                 return True
@@ -3700,25 +4065,34 @@ class MessageHandler:
             bookings.sort(key=lambda b: b.get('created_at') or b.get('date_time') or '', reverse=True)
         except Exception:
             pass
+        # Only the 10 most recent are listed (and selectable); enrich just those
+        bookings = bookings[:10]
+        # Resolve provider names for the distinct numbers: one $in query when the
+        # backend supports it, otherwise concurrent single lookups
+        pnums = list(dict.fromkeys(b.get('provider_whatsapp_number') for b in bookings if b.get('provider_whatsapp_number')))
+        name_map: Dict[str, Optional[str]] = {}
+        if pnums and hasattr(self.db, 'get_providers_by_whatsapp_numbers'):
+            try:
+                found = await self.db.get_providers_by_whatsapp_numbers(pnums)
+                name_map = {pn: pdoc.get('name') for pn, pdoc in found.items()}
+            except Exception:
+                pass
+        elif pnums and hasattr(self.db, 'get_provider_by_whatsapp'):
+            docs = await asyncio.gather(*(self.db.get_provider_by_whatsapp(pn) for pn in pnums), return_exceptions=True)
+            for pn, pdoc in zip(pnums, docs):
+                if pdoc and not isinstance(pdoc, Exception):
+                    name_map[pn] = pdoc.get('name')
         enriched = []
         for b in bookings:
             pnum = b.get('provider_whatsapp_number')
-            pname = None
-            if pnum and hasattr(self.db, 'get_provider_by_whatsapp'):
-                try:
-                    pdoc = await self.db.get_provider_by_whatsapp(pnum)
-                    if pdoc:
-                        pname = pdoc.get('name')
-                except Exception:
-                    pass
             enriched.append({
                 'id': b.get('booking_id') or '',
-                'provider': pname or pnum or 'Provider',
+                'provider': name_map.get(pnum) or pnum or 'Provider',
                 'time': self._format_booking_time_for_display(b.get('date_time') or b.get('booking_time') or ''),
                 'status': b.get('status') or 'pending',
             })
         lines = []
-        for idx, e in enumerate(enriched[:10], start=1):
+        for idx, e in enumerate(enriched, start=1):
             lines.append(f"{idx}) {e['provider']} — {e['time']} [{e['status']}]\nRef: {e['id']}")
         header = "Your bookings"
         if mode == "cancel":
@@ -3731,7 +4105,7 @@ class MessageHandler:
             body = "Here are your recent bookings:\n\n" + "\n".join(lines)
             footer = None
         buttons = []
-        for idx, e in enumerate(enriched[:3], start=1):
+        for idx, e in enumerate(islice(enriched, 3), start=1):
             title = f"{e['provider']}"
             buttons.append({'id': f"b_{e['id']}", 'title': title})
         await self._log_and_send_interactive(user_number, header, body, buttons, footer)
@@ -3740,18 +4114,12 @@ class MessageHandler:
 
     async def handle_view_bookings_state(self, user_number: str, message_text: str, session: Dict, user: Dict) -> None:
         text = message_text.strip().lower()
-        if any(k in text for k in ["cancel", "cancel booking"]):
+        # Any "cancel" only opens the cancel list; the user picks from it next turn
+        if "cancel" in text:
             await self.show_user_bookings(user_number, session, user, mode="cancel")
             session['state'] = ConversationState.CANCEL_BOOKING_SELECT
             return
-        # Inline: "cancel booking 2" while viewing list
-        m_cancel_inline = re.search(r"\bcancel\s+booking\s+(\d+)\b", re.sub(r"\s+", " ", text))
-        if m_cancel_inline:
-            await self.show_user_bookings(user_number, session, user, mode="cancel")
-            session['state'] = ConversationState.CANCEL_BOOKING_SELECT
-            await self.handle_cancel_booking_select(user_number, m_cancel_inline.group(1), session, user)
-            return
-        if any(k in text for k in ["reschedule", "postpone", "change time", "move booking", "reschedule booking"]):
+        if VIEW_RESCHEDULE_RE.search(text):
             await self.show_user_bookings(user_number, session, user, mode="reschedule")
             session['state'] = ConversationState.RESCHEDULE_BOOKING_SELECT
             return
@@ -3766,10 +4134,7 @@ class MessageHandler:
         if text in yes_vals:
             prev_state_val = (session.get('data') or {}).get('previous_state')
             if prev_state_val:
-                try:
-                    session['state'] = ConversationState(prev_state_val)
-                except Exception:
-                    session['state'] = ConversationState.SERVICE_SEARCH
+                session['state'] = _STATE_BY_VALUE.get(prev_state_val, ConversationState.SERVICE_SEARCH)
             else:
                 session['state'] = ConversationState.SERVICE_SEARCH
 
@@ -3789,8 +4154,8 @@ class MessageHandler:
             try:
                 sd = session.setdefault('data', {})
                 for k in [
-                    'service_type', 'providers', 'selected_provider', 'selected_provider_index',
-                    'booking_time', '_pending_booking', 'all_providers', 'location',
+                    'service_type', 'providers', '_providers_lc', 'selected_provider', 'selected_provider_index',
+                    'booking_time', 'booking_time_dt', '_pending_booking', 'all_providers', 'location',
                     '_bookings_list', '_cancel_booking_id', '_reschedule_booking_id', '_reschedule_new_time',
                     'issue', 'previous_state'
                 ]:
@@ -3812,12 +4177,12 @@ class MessageHandler:
 
     async def handle_cancel_booking_select(self, user_number: str, message_text: str, session: Dict, user: Dict) -> None:
         items = session.get('data', {}).get('_bookings_list') or []
+        n = len(items)
         selected = None
         # Accept number anywhere in text
-        num_match = re.search(r"\b(\d+)\b", str(message_text))
-        if num_match:
-            i = int(num_match.group(1))
-            if 1 <= i <= len(items):
+        i = _booking_number(message_text)
+        if i is not None:
+            if 0 < i <= n:
                 selected = items[i-1]
                 try:
                     bid = selected.get('id')
@@ -3839,49 +4204,77 @@ class MessageHandler:
         session['data'].pop('_bookings_list', None)
 
     async def handle_reschedule_booking_select(self, user_number: str, message_text: str, session: Dict, user: Dict) -> None:
-        items = session.get('data', {}).get('_bookings_list') or []
+        data = session.setdefault('data', {})
+        items = data.get('_bookings_list') or []
+        n = len(items)
         selected = None
-        num_match = re.search(r"\b(\d+)\b", str(message_text))
-        if num_match:
-            i = int(num_match.group(1))
-            if 1 <= i <= len(items):
-                selected = items[i-1]
+        i = _booking_number(message_text)
+        if i is not None and 0 < i <= n:
+            selected = items[i-1]
         if not selected:
             await self._log_and_send_response(user_number, "Please reply with the number of the booking to reschedule.", "reschedule_booking_select_invalid")
             return
-        session['data']['_reschedule_booking_id'] = selected['id']
-        await self._log_and_send_response(user_number, "What new date/time would you like? (e.g., 'tomorrow 10am', 'Dec 20 14:30')", "reschedule_booking_ask_time")
+        data['_reschedule_booking_id'] = selected['id']
         session['state'] = ConversationState.RESCHEDULE_BOOKING_NEW_TIME
+        await self._log_and_send_response(user_number, "What new date/time would you like? (e.g., 'tomorrow 10am', 'Dec 20 14:30')", "reschedule_booking_ask_time")
 
     async def handle_reschedule_booking_new_time(self, user_number: str, message_text: str, session: Dict, user: Dict) -> None:
-        # Canonicalize new time
+        # Canonicalize new time; skip the parser for text that cannot be a time
+        text = (message_text or '').strip()
+        confirm_now = _RESCHED_CONFIRM_INLINE_RE.search(text) is not None
+        if confirm_now:
+            text = _RESCHED_CONFIRM_INLINE_RE.sub(' ', text).strip(' ,.!')
         new_dt = None
-        try:
-            new_dt = self._canonicalize_booking_time(message_text)
-        except Exception:
-            new_dt = None
+        if len(text) <= MAX_TIME_TEXT_LEN and _DT_HINT_RE.search(text):
+            new_dt = await self._canonicalize_booking_time_async(text)
         if not new_dt:
             await self._log_and_send_response(user_number, "I couldn't understand that time. Try 'tomorrow at 10am' or 'Dec 20 14:30'.", "reschedule_time_invalid")
             return
-        new_iso = new_dt.strftime('%Y-%m-%d %H:%M')
-        session['data']['_reschedule_new_time'] = new_iso
-        await self._log_and_send_response(user_number, f"Reschedule to {new_iso}? Reply 'yes' to confirm or 'no' to keep the original time.", "reschedule_booking_confirm")
+        new_iso = _fmt_booking_time(new_dt)
+        data = session.setdefault('data', {})
+        bid = data.get('_reschedule_booking_id')
+        if confirm_now and bid:
+            # Already confirmed in this message; skip the confirmation round-trip
+            for k in _RESCHED_KEYS:
+                data.pop(k, None)
+            session['state'] = ConversationState.SERVICE_SEARCH
+            await self._apply_reschedule(user_number, bid, new_iso)
+            return
+        data['_reschedule_new_time'] = new_iso
         session['state'] = ConversationState.RESCHEDULE_BOOKING_CONFIRM
+        await self._log_and_send_response(user_number, _RESCHED_CONFIRM_TMPL(new_iso), "reschedule_booking_confirm")
+
+    async def _apply_reschedule(self, user_number: str, booking_id: str, new_iso: str) -> None:
+        """Persist a confirmed reschedule and tell the customer how it went.
+
+        The customer is only told the booking moved once the write has landed;
+        the other-party notice then goes out in the background.
+        """
+        try:
+            ok = await self.db.update_booking_time(booking_id, new_iso, set_status='pending')
+        except Exception as e:
+            logger.error(f"Reschedule of booking {booking_id} failed: {e}")
+            ok = False
+        if not ok:
+            await self._log_and_send_response(user_number, _RESCHED_FAILED_MSG, "booking_rescheduled_failed")
+            return
+        _spawn_background(
+            self._notify_booking_other_party(user_number, booking_id, 'rescheduled', new_time=new_iso),
+            f"reschedule notice {booking_id}",
+        )
+        await self._log_and_send_response(user_number, _RESCHED_OK_TMPL(new_iso), "booking_rescheduled_success")
 
     async def handle_reschedule_booking_confirm(self, user_number: str, message_text: str, session: Dict, user: Dict) -> None:
-        text = message_text.strip().lower()
-        bid = session.get('data', {}).get('_reschedule_booking_id')
-        new_iso = session.get('data', {}).get('_reschedule_new_time')
-        if text in ['yes', 'y', 'confirm', 'ok', 'sure'] and bid and new_iso:
-            try:
-                await self.db.update_booking_time(bid, new_iso, set_status='pending')
-                await self._notify_booking_other_party(user_number, bid, 'rescheduled', new_time=new_iso)
-            except Exception:
-                pass
-            await self._log_and_send_response(user_number, f"Your booking has been rescheduled to {new_iso}.", "booking_rescheduled_success")
-        else:
-            await self._log_and_send_response(user_number, "Okay, I will keep your original booking time.", "booking_rescheduled_aborted")
+        text = (message_text or '').strip().lower()
+        # The reschedule keys are one-shot: consume them whether or not this confirms.
+        # Session changes are local and don't depend on the sends; apply them first
+        data = session.setdefault('data', {})
+        bid = data.pop('_reschedule_booking_id', None)
+        new_iso = data.pop('_reschedule_new_time', None)
+        data.pop('_bookings_list', None)
+        confirmed = bool(bid and new_iso) and text in _CONFIRM_WORDS
         session['state'] = ConversationState.SERVICE_SEARCH
-        session['data'].pop('_reschedule_booking_id', None)
-        session['data'].pop('_reschedule_new_time', None)
-        session['data'].pop('_bookings_list', None)
+        if confirmed:
+            await self._apply_reschedule(user_number, bid, new_iso)
+        else:
+            await self._log_and_send_response(user_number, _RESCHED_ABORT_MSG, "booking_rescheduled_aborted")
@@ -101,6 +101,17 @@ class MongoService:
         db = get_database()
         return await db.providers.find_one({"whatsapp_number": whatsapp_number})
 
+    async def get_providers_by_whatsapp_numbers(self, whatsapp_numbers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Name and number of each matching provider in one query, keyed by WhatsApp number."""
+        if not whatsapp_numbers:
+            return {}
+        db = get_database()
+        cursor = db.providers.find(
+            {"whatsapp_number": {"$in": list(whatsapp_numbers)}},
+            {"whatsapp_number": 1, "name": 1},
+        )
+        return {doc["whatsapp_number"]: doc async for doc in cursor}
+
     async def get_provider_by_id(self, provider_id: str) -> Optional[Dict[str, Any]]:
         db = get_database()
         try: